@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from app.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,16 @@
 import sys
-import os
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
-from PySide6.QtQml import QQmlApplicationEngine
-from PySide6.QtCore import QUrl, QTimer
-from PySide6.QtGui import QPalette, QColor
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from app.bridge import Bridge, register_bridge
-
 
 def main():
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtQml import QQmlApplicationEngine
+    from PySide6.QtCore import QUrl, QTimer
+
+    from app.bridge import register_bridge
+
     aplicacao = QApplication(sys.argv)
     aplicacao.setApplicationName("Arvores Multiplas")
     aplicacao.setApplicationDisplayName("Arvores Multiplas")
@@ -1,4 +1,4 @@
-from PySide6.QtCore import QObject, Signal, Slot, Property
+from PySide6.QtCore import QObject, QTimer, Signal, Slot, Property
 from PySide6.QtQml import qmlRegisterType
 from typing import List, Dict, Any
 
@@ -10,6 +10,7 @@ class Bridge(QObject):
 
     treeChanged = Signal(list, list)
     metricsChanged = Signal(dict)
+    profileChanged = Signal(dict)
     eventsReady = Signal(list)
     message = Signal(str, str)
     degreeChanged = Signal()
@@ -19,18 +20,25 @@ class Bridge(QObject):
         self._grau = 3
         chaves_maximas = self._grau - 1
         self._arvore = BTree(max_keys=chaves_maximas)
+        self._arvore.enable_instrumentation()
         self._emit_tree_update()
 
+        self._relogio_perfil = QTimer(self)
+        self._relogio_perfil.setInterval(1000)
+        self._relogio_perfil.timeout.connect(self._emit_profile_update)
+        self._relogio_perfil.start()
+
     @Property(int, notify=degreeChanged)
     def degree(self):
         return self._grau
 
     @degree.setter
     def degree(self, valor):
-        if valor != self._grau and valor >= 2:
+        if valor != self._grau and valor >= 3:
             self._grau = valor
             chaves_maximas = valor - 1
             self._arvore = BTree(max_keys=chaves_maximas)
+            self._arvore.enable_instrumentation()
             self._emit_tree_update()
             self.degreeChanged.emit()
             self.message.emit(f"Grau {valor} → máx {chaves_maximas} chaves por nó. Arvore reiniciada.", "info")
@@ -61,9 +69,11 @@ class Bridge(QObject):
                 if eventos and eventos[0].get("type") != "error":
                     todos_eventos.extend(eventos)
                     contador_inseridas += 1
-                else:
+                elif eventos:
                     mensagem_erro = eventos[0].get("message", f"Erro ao inserir {chave}")
                     self.message.emit(mensagem_erro, "error")
+                else:
+                    self.message.emit(f"Chave {chave} já existe", "error")
 
             if contador_inseridas > 0:
                 self._emit_tree_update()
@@ -102,9 +112,11 @@ class Bridge(QObject):
                 if eventos and eventos[0].get("type") != "error":
                     todos_eventos.extend(eventos)
                     contador_removidas += 1
-                else:
+                elif eventos:
                     mensagem_erro = eventos[0].get("message", f"Chave {chave} não encontrada")
                     self.message.emit(mensagem_erro, "error")
+                else:
+                    self.message.emit(f"Chave {chave} não encontrada", "error")
 
             if contador_removidas > 0:
                 self._emit_tree_update()
@@ -122,7 +134,9 @@ class Bridge(QObject):
         try:
             eventos = self._arvore.delete(chave)
 
-            if eventos and eventos[0].get("type") == "error":
+            if eventos is None:
+                self.message.emit(f"Chave {chave} não encontrada", "error")
+            elif eventos and eventos[0].get("type") == "error":
                 mensagem_erro = eventos[0].get("message", f"Erro ao remover {chave}")
                 self.message.emit(mensagem_erro, "error")
             else:
@@ -146,6 +160,7 @@ class Bridge(QObject):
 
             if eventos:
                 self.eventsReady.emit(eventos)
+            self._emit_profile_update()
 
         except Exception as e:
             self.message.emit(f"Erro na busca: {str(e)}", "error")
@@ -166,8 +181,8 @@ class Bridge(QObject):
 
     @Slot(int)
     def setDegree(self, t: int):
-        if t < 2:
-            self.message.emit("Grau mínimo deve ser pelo menos 2", "error")
+        if t < 3:
+            self.message.emit("Grau mínimo deve ser pelo menos 3", "error")
             return
 
         if t != self._grau:
@@ -207,10 +222,16 @@ class Bridge(QObject):
 
             self.treeChanged.emit(nos, arestas)
             self.metricsChanged.emit(metricas)
+            self._emit_profile_update()
 
         except Exception as e:
             self.message.emit(f"Erro na atualização: {str(e)}", "error")
 
+    def _emit_profile_update(self):
+        instrumentacao = self._arvore.instrumentation
+        if instrumentacao is not None:
+            self.profileChanged.emit(instrumentacao.summary())
+
 
 def register_bridge():
     qmlRegisterType(Bridge, "BTreeApp", 1, 0, "Bridge")
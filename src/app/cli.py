@@ -0,0 +1,391 @@
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import List, Optional, Tuple
+
+from core.btree import BTree
+from core.export import PREENCHIMENTOS, write_png_tiles, write_svg
+from core.ingest import FORMATOS, iter_keys
+from core.instrumentation import Instrumentation
+from core.policies import POLITICAS
+from core.workload import DISTRIBUICOES, generate_trace, read_trace, replay, write_trace
+
+GRAU_MINIMO = 3
+COMANDOS_ARVORE_PROPRIA = ("benchmark", "replay")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    comum = argparse.ArgumentParser(add_help=False)
+    comum.add_argument("-d", "--degree", type=int, default=3,
+                       help="grau da árvore (máx. chaves por nó = grau - 1)")
+    comum.add_argument("-p", "--policy", choices=sorted(POLITICAS), default="classic",
+                       help="política de divisão dos nós cheios")
+    comum.add_argument("-a", "--append-optimized", action="store_true",
+                       help="insere chaves crescentes direto na folha mais à direita")
+    comum.add_argument("--filter", choices=("bloom", "bitmap"),
+                       help="filtro de pertinência consultado antes de descer na árvore")
+    comum.add_argument("--filter-range", metavar="MIN,MAX",
+                       help="intervalo de chaves coberto pelo filtro bitmap")
+    comum.add_argument("-f", "--format", choices=FORMATOS, default="auto",
+                       help="formato das entradas: uma chave por linha, csv ou int64 binário")
+    comum.add_argument("-c", "--chunk-size", type=int, default=4096,
+                       help="quantidade de chaves lidas por bloco")
+    comum.add_argument("-l", "--load", action="append", default=[], metavar="ARQUIVO",
+                       help="arquivo com chaves inseridas antes do comando ('-' para stdin)")
+    comum.add_argument("--instrument", action="store_true",
+                       help="imprime contadores e latências das operações em JSON (stderr)")
+    comum.add_argument("--cprofile", action="store_true",
+                       help="captura um perfil cProfile do comando (implica --instrument)")
+    comum.add_argument("--tracemalloc", action="store_true",
+                       help="mede a memória alocada pelo comando (implica --instrument)")
+
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Operações em lote na Árvore B sem interface gráfica."
+    )
+    comandos = parser.add_subparsers(dest="command", required=True)
+
+    inserir = comandos.add_parser("insert", parents=[comum], help="insere chaves")
+    inserir.add_argument("inputs", nargs="*", default=["-"], metavar="ARQUIVO")
+
+    remover = comandos.add_parser("delete", parents=[comum], help="remove chaves")
+    remover.add_argument("inputs", nargs="*", default=["-"], metavar="ARQUIVO")
+
+    buscar = comandos.add_parser("query", parents=[comum], help="busca chaves")
+    buscar.add_argument("inputs", nargs="*", default=["-"], metavar="ARQUIVO")
+    buscar.add_argument("--list", action="store_true",
+                        help="imprime o resultado de cada chave (chave, 1 ou 0)")
+
+    metricas = comandos.add_parser("dump-metrics", parents=[comum],
+                                   help="insere as chaves e imprime as métricas em JSON")
+    metricas.add_argument("inputs", nargs="*", default=[], metavar="ARQUIVO")
+
+    validar = comandos.add_parser("validate", parents=[comum],
+                                  help="insere as chaves e valida a estrutura")
+    validar.add_argument("inputs", nargs="*", default=[], metavar="ARQUIVO")
+    validar.add_argument("--sample", type=int, metavar="N",
+                         help="verifica apenas N caminhos aleatórios da raiz até uma folha")
+    validar.add_argument("--seed", type=int, help="semente dos caminhos amostrados")
+
+    comparar = comandos.add_parser("benchmark", parents=[comum],
+                                   help="compara as políticas de divisão com as mesmas chaves")
+    comparar.add_argument("inputs", nargs="*", default=["-"], metavar="ARQUIVO")
+
+    gerar = comandos.add_parser("workload", help="gera um trace de operações em arquivo binário")
+    gerar.add_argument("output", metavar="TRACE")
+    gerar.add_argument("-n", "--operations", type=int, default=100_000)
+    gerar.add_argument("--mix", default="0.5,0.1,0.4",
+                       help="pesos de insert, delete e search separados por vírgula")
+    gerar.add_argument("--distribution", choices=DISTRIBUICOES, default="uniform")
+    gerar.add_argument("--key-space", type=int, default=1_000_000)
+    gerar.add_argument("--zipf-exponent", type=float, default=1.1)
+    gerar.add_argument("--window", type=int, default=10_000,
+                       help="máximo de chaves vivas na distribuição sliding_window")
+    gerar.add_argument("--seed", type=int)
+
+    reproduzir = comandos.add_parser("replay", parents=[comum],
+                                     help="reproduz um trace e mede vazão e latência")
+    reproduzir.add_argument("trace", metavar="TRACE")
+    reproduzir.add_argument("--events", action="store_true",
+                            help="mantém a geração de eventos durante a reprodução")
+    reproduzir.add_argument("--degrees", help="graus a comparar, separados por vírgula")
+    reproduzir.add_argument("--policies", help="políticas a comparar, separadas por vírgula")
+    reproduzir.add_argument("--json", action="store_true", help="imprime o relatório completo em JSON")
+
+    exportar = comandos.add_parser("export", parents=[comum],
+                                   help="insere as chaves e exporta o diagrama da árvore")
+    exportar.add_argument("inputs", nargs="*", default=[], metavar="ARQUIVO")
+    exportar.add_argument("-o", "--output", required=True,
+                          help="arquivo SVG ('-' para stdout) ou diretório dos tiles PNG")
+    exportar.add_argument("--png", action="store_true",
+                          help="grava tiles PNG (um nível por linha) via Qt offscreen")
+    exportar.add_argument("--max-levels", type=int, metavar="N",
+                          help="exporta apenas os N primeiros níveis")
+    exportar.add_argument("--fill", choices=PREENCHIMENTOS, default="none",
+                          help="cor dos nós: fixa, por ocupação, folha/interno ou por nível")
+    exportar.add_argument("--no-keys", action="store_true", help="omite as chaves dos nós")
+    exportar.add_argument("--tile-size", type=int, default=2048, help="largura dos tiles PNG em pixels")
+    exportar.add_argument("--scale", type=float, default=1.0, help="escala dos tiles PNG")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "workload":
+        return _cmd_workload(args)
+
+    if args.degree < GRAU_MINIMO:
+        parser.error(f"Grau mínimo deve ser pelo menos {GRAU_MINIMO}")
+
+    if args.command == "replay" and args.degrees:
+        try:
+            args.degrees = _parse_degrees(args.degrees)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.command in COMANDOS_ARVORE_PROPRIA:
+        ignoradas = [opcao for opcao, valor in (("--load", args.load), ("--instrument", args.instrument),
+                                                ("--cprofile", args.cprofile),
+                                                ("--tracemalloc", args.tracemalloc)) if valor]
+        if ignoradas:
+            parser.error(f"{', '.join(ignoradas)} não se aplica(m) ao comando {args.command}, "
+                         f"que cria as próprias árvores")
+
+    try:
+        intervalo = _parse_range(args.filter_range)
+        arvore = BTree(max_keys=args.degree - 1, policy=args.policy, events=False,
+                       append_optimized=args.append_optimized,
+                       membership_filter=args.filter, filter_range=intervalo)
+    except ValueError as e:
+        parser.error(str(e))
+
+    instrumentacao = None
+    if args.instrument or args.cprofile or args.tracemalloc:
+        instrumentacao = arvore.enable_instrumentation(Instrumentation(window=None))
+
+    try:
+        if args.load:
+            _insert_all(arvore, args.load, args)
+
+        if args.cprofile or args.tracemalloc:
+            with instrumentacao.capture(cprofile=args.cprofile, memoria=args.tracemalloc):
+                codigo = _run_command(arvore, args)
+        else:
+            codigo = _run_command(arvore, args)
+
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+
+    if instrumentacao is not None:
+        print(instrumentacao.to_json(), file=sys.stderr)
+    return codigo
+
+
+def _parse_range(texto: Optional[str]) -> Optional[Tuple[int, int]]:
+    if not texto:
+        return None
+    try:
+        minimo, maximo = (int(valor) for valor in texto.split(","))
+    except ValueError:
+        raise ValueError(f"Intervalo inválido: {texto!r}, use MIN,MAX") from None
+    return minimo, maximo
+
+
+def _parse_degrees(texto: str) -> List[int]:
+    try:
+        graus = [int(grau) for grau in texto.split(",")]
+    except ValueError:
+        raise ValueError(f"Lista de graus inválida: {texto!r}") from None
+    for grau in graus:
+        if grau < GRAU_MINIMO:
+            raise ValueError(f"Grau mínimo deve ser pelo menos {GRAU_MINIMO} (recebido {grau})")
+    return graus
+
+
+def _run_command(arvore: BTree, args) -> int:
+    if args.command == "insert":
+        return _cmd_insert(arvore, args)
+    if args.command == "delete":
+        return _cmd_delete(arvore, args)
+    if args.command == "query":
+        return _cmd_query(arvore, args)
+    if args.command == "dump-metrics":
+        return _cmd_dump_metrics(arvore, args)
+    if args.command == "benchmark":
+        return _cmd_benchmark(args)
+    if args.command == "replay":
+        return _cmd_replay(args)
+    if args.command == "export":
+        return _cmd_export(arvore, args)
+    return _cmd_validate(arvore, args)
+
+
+def _insert_all(arvore: BTree, caminhos: List[str], args) -> int:
+    contador_inseridas = 0
+    for bloco in iter_keys(caminhos, args.format, args.chunk_size):
+        for chave in bloco:
+            if arvore.insert(chave) is not None:
+                contador_inseridas += 1
+    return contador_inseridas
+
+
+def _cmd_insert(arvore: BTree, args) -> int:
+    inicio = time.perf_counter()
+    contador_inseridas = _insert_all(arvore, args.inputs, args)
+    duracao = time.perf_counter() - inicio
+
+    print(f"{contador_inseridas} chave(s) inserida(s) em {duracao:.3f}s")
+    return 0
+
+
+def _cmd_delete(arvore: BTree, args) -> int:
+    inicio = time.perf_counter()
+    contador_removidas = 0
+    contador_ausentes = 0
+
+    for bloco in iter_keys(args.inputs, args.format, args.chunk_size):
+        for chave in bloco:
+            if arvore.delete(chave) is not None:
+                contador_removidas += 1
+            else:
+                contador_ausentes += 1
+
+    duracao = time.perf_counter() - inicio
+    print(f"{contador_removidas} chave(s) removida(s), "
+          f"{contador_ausentes} não encontrada(s) em {duracao:.3f}s")
+    return 0
+
+
+def _cmd_query(arvore: BTree, args) -> int:
+    inicio = time.perf_counter()
+    contador_encontradas = 0
+    contador_ausentes = 0
+
+    for bloco in iter_keys(args.inputs, args.format, args.chunk_size):
+        linhas = []
+        for chave in bloco:
+            encontrou, _, _ = arvore.search(chave)
+            if encontrou:
+                contador_encontradas += 1
+            else:
+                contador_ausentes += 1
+            if args.list:
+                linhas.append(f"{chave}\t{int(encontrou)}")
+        if linhas:
+            print("\n".join(linhas))
+
+    duracao = time.perf_counter() - inicio
+    print(f"{contador_encontradas} chave(s) encontrada(s), "
+          f"{contador_ausentes} não encontrada(s) em {duracao:.3f}s",
+          file=sys.stderr if args.list else sys.stdout)
+    return 0
+
+
+def _cmd_dump_metrics(arvore: BTree, args) -> int:
+    _insert_all(arvore, args.inputs, args)
+
+    metricas = arvore.metrics()
+    metricas["degree"] = args.degree
+    metricas["maxKeys"] = args.degree - 1
+
+    print(json.dumps(metricas, indent=2))
+    return 0
+
+
+def _cmd_validate(arvore: BTree, args) -> int:
+    _insert_all(arvore, args.inputs, args)
+
+    relatorio = arvore.validate_report(sample=args.sample, seed=args.seed)
+    if relatorio:
+        print(f"Árvore válida ({relatorio.checked_nodes} nó(s) verificado(s))")
+        return 0
+
+    print(f"Árvore inválida: regra {relatorio.rule} no nó {relatorio.node_id}: {relatorio.message}")
+    return 1
+
+
+def _cmd_export(arvore: BTree, args) -> int:
+    _insert_all(arvore, args.inputs, args)
+
+    if args.png:
+        resumo = write_png_tiles(arvore, args.output, args.tile_size, args.scale,
+                                 args.max_levels, args.fill, not args.no_keys)
+        print(f"{resumo['tiles']} tile(s) de {resumo['levels']} nível(is) gravado(s) em {args.output}")
+        return 0
+
+    resumo = write_svg(arvore, args.output, args.max_levels, args.fill, not args.no_keys)
+    if args.output != "-":
+        print(f"{resumo['nodes']} nó(s) de {resumo['levels']} nível(is) gravado(s) em {args.output}")
+    return 0
+
+
+def _cmd_benchmark(args) -> int:
+    chaves = [chave for bloco in iter_keys(args.inputs, args.format, args.chunk_size)
+              for chave in bloco]
+
+    print(f"{len(chaves)} chave(s), grau {args.degree}")
+    print(f"{'política':<14}{'nós':>10}{'altura':>8}{'ocupação':>10}{'memória':>12}{'tempo':>10}")
+
+    intervalo = _parse_range(args.filter_range)
+
+    def construir(nome: str) -> BTree:
+        arvore = BTree(max_keys=args.degree - 1, policy=nome, events=False,
+                       append_optimized=args.append_optimized,
+                       membership_filter=args.filter, filter_range=intervalo)
+        for chave in chaves:
+            arvore.insert(chave)
+        return arvore
+
+    for nome in POLITICAS:
+        inicio = time.perf_counter()
+        arvore = construir(nome)
+        duracao = time.perf_counter() - inicio
+        del arvore
+
+        rastreando = not tracemalloc.is_tracing()
+        if rastreando:
+            tracemalloc.start()
+        memoria_inicial, _ = tracemalloc.get_traced_memory()
+        arvore = construir(nome)
+        memoria, _ = tracemalloc.get_traced_memory()
+        if rastreando:
+            tracemalloc.stop()
+
+        metricas = arvore.metrics()
+        print(f"{nome:<14}{metricas['totalNodes']:>10}{metricas['height']:>8}"
+              f"{metricas['fillFactor']:>10.1%}{(memoria - memoria_inicial) / 1024:>10.0f}KB"
+              f"{duracao:>9.3f}s")
+        del arvore
+
+    return 0
+
+
+def _cmd_workload(args) -> int:
+    try:
+        mix = [float(peso) for peso in args.mix.split(",")]
+        operacoes = generate_trace(args.operations, mix, args.distribution, args.key_space,
+                                   args.zipf_exponent, args.window, args.seed)
+        total = write_trace(args.output, operacoes)
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+
+    print(f"{total} operação(ões) gravada(s) em {args.output}")
+    return 0
+
+
+def _cmd_replay(args) -> int:
+    graus = args.degrees or [args.degree]
+    politicas = args.policies.split(",") if args.policies else [args.policy]
+
+    relatorios = []
+    for grau in graus:
+        for politica in politicas:
+            arvore = BTree(max_keys=grau - 1, policy=politica,
+                           append_optimized=args.append_optimized,
+                           membership_filter=args.filter,
+                           filter_range=_parse_range(args.filter_range))
+            relatorio = replay(arvore, read_trace(args.trace, args.chunk_size), events=args.events)
+            relatorio["degree"] = grau
+            relatorio["policy"] = politica
+            relatorios.append(relatorio)
+
+    if args.json:
+        print(json.dumps(relatorios, indent=2))
+        return 0
+
+    print(f"{'grau':>5} {'política':<14}{'ops/s':>12}{'p50':>10}{'p99':>10}"
+          f"{'nós':>10}{'altura':>8}{'ocupação':>10}")
+    for relatorio in relatorios:
+        latencia = relatorio["latency"]["all"]
+        metricas = relatorio["metrics"]
+        print(f"{relatorio['degree']:>5} {relatorio['policy']:<14}{relatorio['opsPerSec']:>12.0f}"
+              f"{latencia['p50Us']:>8.1f}µs{latencia['p99Us']:>8.1f}µs"
+              f"{metricas['totalNodes']:>10}{metricas['height']:>8}{metricas['fillFactor']:>10.1%}")
+    return 0
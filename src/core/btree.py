@@ -1,5 +1,11 @@
 import uuid
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple, Union
+
+from .filters import MembershipFilter, make_filter
+from .instrumentation import Instrumentation
+from .policies import SplitPolicy, get_policy
+from .validation import (ValidationReport, validate_incremental, validate_sampled,
+                         validate_tree)
 
 
 class BNode:
@@ -20,9 +26,22 @@ class BNode:
         return i
 
 
+class _NullEvents(list):
+
+    def append(self, evento):
+        pass
+
+    def extend(self, eventos):
+        pass
+
+
 class BTree:
 
-    def __init__(self, t: int = 2, max_keys: Optional[int] = None):
+    def __init__(self, t: int = 2, max_keys: Optional[int] = None,
+                 policy: Union[str, SplitPolicy] = "classic", events: bool = True,
+                 append_optimized: bool = False,
+                 membership_filter: Optional[Union[str, MembershipFilter]] = None,
+                 filter_range: Optional[Tuple[int, int]] = None):
         if max_keys is not None:
             t = max(2, (max_keys + 1) // 2)
             self._max_keys = max_keys
@@ -31,33 +50,85 @@ class BTree:
             
         if t < 2:
             raise ValueError("O grau mínimo deve ser pelo menos 2")
+        if self._max_keys < 2:
+            raise ValueError("Cada nó deve comportar pelo menos 2 chaves")
         self._t = t
+        self._min_keys = self._max_keys // 2
+        self._politica = get_policy(policy)
+        self.events_enabled = events
+        self._append_optimized = append_optimized
+        self._caminho_direito: Optional[List[BNode]] = None
+        self._filtro: Optional[MembershipFilter] = None
+        if membership_filter is not None:
+            self._filtro = make_filter(membership_filter, filter_range)
         self.root: Optional[BNode] = None
+        self._instrumentacao: Optional[Instrumentation] = None
+        self._tocados: Optional[Set[BNode]] = None
+
+    @property
+    def policy(self) -> SplitPolicy:
+        return self._politica
+
+    @property
+    def membership_filter(self) -> Optional[MembershipFilter]:
+        return self._filtro
+
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        return self._instrumentacao
+
+    def enable_instrumentation(self, instrumentacao: Optional[Instrumentation] = None) -> Instrumentation:
+        if self._instrumentacao is not None:
+            return self._instrumentacao
+        self._instrumentacao = instrumentacao or Instrumentation()
+        self._instrumentacao.attach(self)
+        return self._instrumentacao
+
+    def disable_instrumentation(self) -> Optional[Instrumentation]:
+        instrumentacao = self._instrumentacao
+        if instrumentacao is not None:
+            instrumentacao.detach()
+            self._instrumentacao = None
+        return instrumentacao
+
+    def _touch(self, nos: Iterable[BNode]):
+        if self._tocados is not None:
+            self._tocados.update(nos)
+
+    def _new_events(self) -> List[Dict[str, Any]]:
+        return [] if self.events_enabled else _NullEvents()
 
     def search(self, key: int) -> Tuple[bool, List[Dict[str, Any]], List[BNode]]:
         eventos = []
         caminho = []
+        registrar = self.events_enabled
 
         if not self.root:
             return False, eventos, caminho
 
+        filtro = self._filtro
+        if filtro is not None and not filtro.might_contain(key):
+            return False, eventos, caminho
+
         atual = self.root
         while atual:
             caminho.append(atual)
-            eventos.append({
-                "type": "visit",
-                "nodeId": atual.id,
-                "keyIndex": None
-            })
+            if registrar:
+                eventos.append({
+                    "type": "visit",
+                    "nodeId": atual.id,
+                    "keyIndex": None
+                })
 
             indice = atual.find_key_index(key)
 
             if indice < len(atual.keys) and atual.keys[indice] == key:
-                eventos.append({
-                    "type": "found",
-                    "nodeId": atual.id,
-                    "keyIndex": indice
-                })
+                if registrar:
+                    eventos.append({
+                        "type": "found",
+                        "nodeId": atual.id,
+                        "keyIndex": indice
+                    })
                 return True, eventos, caminho
 
             if atual.leaf:
@@ -65,14 +136,20 @@ class BTree:
 
             atual = atual.children[indice]
 
+        if filtro is not None and filtro.covers(key):
+            filtro.record_false_positive()
         return False, eventos, caminho
 
-    def insert(self, key: int) -> List[Dict[str, Any]]:
-        eventos = []
+    def insert(self, key: int) -> Optional[List[Dict[str, Any]]]:
+        eventos = self._new_events()
+
+        if self._append_optimized and self.root and self._append_rightmost(key, eventos):
+            self._filter_add(key)
+            return eventos
 
         encontrado, _, _ = self.search(key)
         if encontrado:
-            return []
+            return None
 
         if not self.root:
             self.root = BNode(leaf=True)
@@ -82,42 +159,120 @@ class BTree:
                 "nodeId": self.root.id,
                 "key": key
             })
+            self._touch((self.root,))
+            self._filter_add(key)
             return eventos
-        self._insert_non_full(self.root, key, eventos)
-        
+        self._insert_key(self.root, key, eventos)
+        self._filter_add(key)
+
         if len(self.root.keys) > self._max_keys:
             nova_raiz = BNode(leaf=False)
             nova_raiz.children.append(self.root)
             self._split_child(nova_raiz, 0, eventos)
             self.root = nova_raiz
+            self._caminho_direito = None
+            self._touch([nova_raiz] + nova_raiz.children)
         return eventos
 
-    def _insert_smart(self, no: BNode, chave: int, eventos: List[Dict[str, Any]]):
+    def _filter_add(self, chave: int):
+        filtro = self._filtro
+        if filtro is None:
+            return
+        filtro.add(chave)
+        if filtro.needs_rebuild():
+            filtro.rebuild(self._iter_keys())
+
+    def _iter_keys(self):
+        if not self.root:
+            return
+        pilha = [self.root]
+        while pilha:
+            no = pilha.pop()
+            yield from no.keys
+            pilha.extend(no.children)
+
+    def _rightmost_path(self) -> List[BNode]:
+        caminho = [self.root]
+        while not caminho[-1].leaf:
+            caminho.append(caminho[-1].children[-1])
+        return caminho
+
+    def _append_rightmost(self, chave: int, eventos: List[Dict[str, Any]]) -> bool:
+        caminho = self._caminho_direito
+        if caminho is None:
+            caminho = self._caminho_direito = self._rightmost_path()
+
+        maior = next((no.keys[-1] for no in reversed(caminho) if no.keys), None)
+        if maior is None or chave <= maior:
+            return False
+
+        folha = caminho[-1]
+        folha.keys.append(chave)
+        eventos.append({
+            "type": "insert_leaf",
+            "nodeId": folha.id,
+            "key": chave,
+            "position": len(folha.keys) - 1
+        })
+        self._touch(caminho)
+
+        nivel = len(caminho) - 1
+        while len(caminho[nivel].keys) > self._max_keys:
+            if nivel == 0:
+                nova_raiz = BNode(leaf=False)
+                nova_raiz.children.append(self.root)
+                self.root = nova_raiz
+                caminho.insert(0, nova_raiz)
+                self._touch((nova_raiz,))
+                nivel = 1
+            self._split_rightmost(caminho, nivel, eventos)
+            nivel -= 1
+
+        return True
+
+    def _split_rightmost(self, caminho: List[BNode], nivel: int, eventos: List[Dict[str, Any]]):
+        cheio = caminho[nivel]
+        pai = caminho[nivel - 1]
+        novo = BNode(leaf=cheio.leaf)
+
+        chave_promovida = cheio.keys.pop()
+        if not cheio.leaf:
+            novo.children.append(cheio.children.pop())
+
+        pai.keys.append(chave_promovida)
+        pai.children.append(novo)
+        caminho[nivel] = novo
+
+        self._touch((pai, cheio, novo))
+
+        eventos.append({
+            "type": "split",
+            "nodeId": cheio.id,
+            "newNodeId": novo.id,
+            "promoted": chave_promovida
+        })
+
+    def _insert_key(self, no: BNode, chave: int, eventos: List[Dict[str, Any]]):
+        indice = no.find_key_index(chave)
+        if self._tocados is not None:
+            self._tocados.add(no)
+
         if no.leaf:
-            indice = no.find_key_index(chave)
             no.keys.insert(indice, chave)
-            
             eventos.append({
                 "type": "insert_leaf",
                 "nodeId": no.id,
                 "key": chave,
                 "position": indice
             })
-        else:
-            indice = no.find_key_index(chave)
-            filho = no.children[indice]
-            
-            if len(filho.keys) >= self._max_keys:
-                if self._try_compact_siblings(no, indice, eventos):
-                    indice = no.find_key_index(chave)
-                    self._insert_smart(no.children[indice], chave, eventos)
-                else:
-                    self._smart_split(no, indice, eventos)
-                    if chave > no.keys[indice]:
-                        indice += 1
-                    self._insert_smart(no.children[indice], chave, eventos)
-            else:
-                self._insert_smart(filho, chave, eventos)
+            return
+
+        self._insert_key(no.children[indice], chave, eventos)
+
+        if len(no.children[indice].keys) > self._max_keys:
+            self._politica.handle_overflow(self, no, indice, eventos)
+            self._caminho_direito = None
+            self._touch(no.children)
 
     def _try_compact_siblings(self, pai: BNode, indice_filho: int, eventos: List[Dict[str, Any]]) -> bool:
         filho = pai.children[indice_filho]
@@ -169,54 +324,6 @@ class BTree:
         
         return True
 
-    def _smart_split(self, pai: BNode, indice: int, eventos: List[Dict[str, Any]]):
-        self._split_child(pai, indice, eventos)
-
-    def _insert_non_full(self, no: BNode, chave: int, eventos: List[Dict[str, Any]]):
-        if no.leaf:
-            indice = no.find_key_index(chave)
-            no.keys.insert(indice, chave)
-            eventos.append({
-                "type": "insert_leaf",
-                "nodeId": no.id,
-                "key": chave,
-                "position": indice
-            })
-        else:
-            indice = no.find_key_index(chave)
-            filho = no.children[indice]
-            if self._max_keys == 2 and len(filho.keys) >= self._max_keys:
-                if self._should_delay_split(no, indice):
-                    self._insert_non_full(filho, chave, eventos)
-                    if len(filho.keys) > self._max_keys:
-                        self._split_child(no, indice, eventos)
-                else:
-                    self._split_child(no, indice, eventos)
-                    if chave > no.keys[indice]:
-                        indice += 1
-                    self._insert_non_full(no.children[indice], chave, eventos)
-            else:
-                if filho.is_full(self):
-                    self._split_child(no, indice, eventos)
-                    if chave > no.keys[indice]:
-                        indice += 1
-                self._insert_non_full(no.children[indice], chave, eventos)
-
-    def _should_delay_split(self, pai: BNode, indice_filho: int) -> bool:
-        if self._max_keys != 2:
-            return False
-        if len(pai.keys) < self._max_keys:
-            return True
-        if indice_filho > 0:
-            irmao_esquerdo = pai.children[indice_filho - 1]
-            if len(irmao_esquerdo.keys) < self._max_keys:
-                return True
-        if indice_filho < len(pai.children) - 1:
-            irmao_direito = pai.children[indice_filho + 1]
-            if len(irmao_direito.keys) < self._max_keys:
-                return True
-        return False
-
     def _split_child(self, pai: BNode, indice: int, eventos: List[Dict[str, Any]]):
         filho_cheio = pai.children[indice]
         novo_filho = BNode(leaf=filho_cheio.leaf)
@@ -242,24 +349,71 @@ class BTree:
             "promoted": chave_meio
         })
 
-    def delete(self, key: int) -> List[Dict[str, Any]]:
-        eventos = []
+    def _split_two_to_three(self, pai: BNode, indice: int, eventos: List[Dict[str, Any]]):
+        if len(pai.children) < 2:
+            self._split_child(pai, indice, eventos)
+            return
+
+        indice_esq = indice if indice < len(pai.children) - 1 else indice - 1
+        filho_esq = pai.children[indice_esq]
+        filho_dir = pai.children[indice_esq + 1]
+        novo_filho = BNode(leaf=filho_esq.leaf)
+
+        todas_chaves = filho_esq.keys + [pai.keys[indice_esq]] + filho_dir.keys
+        todos_filhos = filho_esq.children + filho_dir.children
+
+        base, sobra = divmod(len(todas_chaves) - 2, 3)
+        fim_esq = base + (1 if sobra > 0 else 0)
+        fim_meio = fim_esq + 1 + base + (1 if sobra > 1 else 0)
+
+        filho_esq.keys = todas_chaves[:fim_esq]
+        filho_dir.keys = todas_chaves[fim_esq + 1:fim_meio]
+        novo_filho.keys = todas_chaves[fim_meio + 1:]
+
+        if not filho_esq.leaf:
+            filho_esq.children = todos_filhos[:fim_esq + 1]
+            filho_dir.children = todos_filhos[fim_esq + 1:fim_meio + 1]
+            novo_filho.children = todos_filhos[fim_meio + 1:]
+
+        pai.keys[indice_esq] = todas_chaves[fim_esq]
+        pai.keys.insert(indice_esq + 1, todas_chaves[fim_meio])
+        pai.children.insert(indice_esq + 2, novo_filho)
+
+        eventos.append({
+            "type": "split_three",
+            "nodeId": filho_esq.id,
+            "siblingId": filho_dir.id,
+            "newNodeId": novo_filho.id,
+            "promoted": [todas_chaves[fim_esq], todas_chaves[fim_meio]]
+        })
+
+    def delete(self, key: int) -> Optional[List[Dict[str, Any]]]:
+        eventos = self._new_events()
         if not self.root:
-            return []
+            return None
         encontrado, _, _ = self.search(key)
         if not encontrado:
-            return []
+            return None
+        self._caminho_direito = None
         self._delete_key(self.root, key, eventos)
-        if len(self.root.keys) == 0 and not self.root.leaf:
+        if self._filtro is not None:
+            self._filtro.remove(key)
+        if len(self.root.keys) == 0:
+            if self.root.leaf:
+                self.root = None
+                return eventos
             self.root = self.root.children[0]
             eventos.append({
                 "type": "root_change",
                 "newRootId": self.root.id
             })
+            self._touch((self.root,))
         return eventos
 
     def _delete_key(self, no: BNode, chave: int, eventos: List[Dict[str, Any]]):
         indice = no.find_key_index(chave)
+        if self._tocados is not None:
+            self._tocados.add(no)
 
         if indice < len(no.keys) and no.keys[indice] == chave:
             if no.leaf:
@@ -275,32 +429,17 @@ class BTree:
             if no.leaf:
                 return
 
-            eh_ultimo = (indice == len(no.keys))
-
-            if len(no.children[indice].keys) < self.t:
-                self._fill_child(no, indice, eventos)
+            self._delete_key(no.children[indice], chave, eventos)
 
-            if eh_ultimo and indice > len(no.keys):
-                self._delete_key(no.children[indice - 1], chave, eventos)
-            else:
-                self._delete_key(no.children[indice], chave, eventos)
+            if len(no.children[indice].keys) < self._min_keys:
+                self._politica.handle_underflow(self, no, indice, eventos)
+                self._touch(no.children)
 
     def _delete_internal(self, no: BNode, indice: int, eventos: List[Dict[str, Any]]):
         chave = no.keys[indice]
 
-        if len(no.children[indice].keys) >= self.t:
-            predecessor = self._get_predecessor(no, indice)
-            no.keys[indice] = predecessor
-            self._delete_key(no.children[indice], predecessor, eventos)
-
-            eventos.append({
-                "type": "replace_predecessor",
-                "nodeId": no.id,
-                "oldKey": chave,
-                "newKey": predecessor
-            })
-
-        elif len(no.children[indice + 1].keys) >= self.t:
+        if (len(no.children[indice].keys) <= self._min_keys
+                and len(no.children[indice + 1].keys) > self._min_keys):
             sucessor = self._get_successor(no, indice)
             no.keys[indice] = sucessor
             self._delete_key(no.children[indice + 1], sucessor, eventos)
@@ -312,9 +451,25 @@ class BTree:
                 "newKey": sucessor
             })
 
+            if len(no.children[indice + 1].keys) < self._min_keys:
+                self._politica.handle_underflow(self, no, indice + 1, eventos)
+                self._touch(no.children)
+
         else:
-            self._merge_children(no, indice, eventos)
-            self._delete_key(no.children[indice], chave, eventos)
+            predecessor = self._get_predecessor(no, indice)
+            no.keys[indice] = predecessor
+            self._delete_key(no.children[indice], predecessor, eventos)
+
+            eventos.append({
+                "type": "replace_predecessor",
+                "nodeId": no.id,
+                "oldKey": chave,
+                "newKey": predecessor
+            })
+
+            if len(no.children[indice].keys) < self._min_keys:
+                self._politica.handle_underflow(self, no, indice, eventos)
+                self._touch(no.children)
 
     def _get_predecessor(self, no: BNode, indice: int) -> int:
         atual = no.children[indice]
@@ -329,10 +484,13 @@ class BTree:
         return atual.keys[0]
 
     def _fill_child(self, no: BNode, indice: int, eventos: List[Dict[str, Any]]):
-        if indice != 0 and len(no.children[indice - 1].keys) >= self.t:
+        if len(no.children) == 1:
+            return
+
+        if indice != 0 and len(no.children[indice - 1].keys) > self._min_keys:
             self._borrow_from_prev(no, indice, eventos)
 
-        elif indice != len(no.children) - 1 and len(no.children[indice + 1].keys) >= self.t:
+        elif indice != len(no.children) - 1 and len(no.children[indice + 1].keys) > self._min_keys:
             self._borrow_from_next(no, indice, eventos)
 
         else:
@@ -399,20 +557,32 @@ class BTree:
 
     def clear(self) -> List[Dict[str, Any]]:
         self.root = None
+        self._caminho_direito = None
+        if self._filtro is not None:
+            self._filtro.clear()
+        if self._tocados is not None:
+            self._tocados = set()
         return [{"type": "clear_all"}]
 
-    def metrics(self) -> Dict[str, int]:
+    def metrics(self) -> Dict[str, Any]:
         if not self.root:
-            return {"height": 0, "totalNodes": 0, "totalKeys": 0}
+            metricas = {"height": 0, "totalNodes": 0, "totalKeys": 0, "fillFactor": 0.0,
+                        "policy": self._politica.name}
+        else:
+            altura = self._get_height(self.root)
+            nos, chaves = self._count_nodes_keys(self.root)
 
-        altura = self._get_height(self.root)
-        nos, chaves = self._count_nodes_keys(self.root)
+            metricas = {
+                "height": altura,
+                "totalNodes": nos,
+                "totalKeys": chaves,
+                "fillFactor": chaves / (nos * self._max_keys),
+                "policy": self._politica.name
+            }
 
-        return {
-            "height": altura,
-            "totalNodes": nos,
-            "totalKeys": chaves
-        }
+        if self._filtro is not None:
+            metricas["filter"] = self._filtro.stats()
+        return metricas
 
     def _get_height(self, no: BNode) -> int:
         if no.leaf:
@@ -431,39 +601,16 @@ class BTree:
         return nos, chaves
 
     def validate(self) -> bool:
-        if not self.root:
-            return True
-
-        return self._validate_node(self.root, None, None, self._get_height(self.root))
-
-    def _validate_node(self, no: BNode, chave_min: Optional[int], 
-                      chave_max: Optional[int], altura_esperada: int) -> bool:
-        if no != self.root and len(no.keys) < self.t - 1:
-            return False
-        if len(no.keys) > 2 * self.t - 1:
-            return False
-
-        for i in range(len(no.keys) - 1):
-            if no.keys[i] >= no.keys[i + 1]:
-                return False
-
-        if chave_min is not None and no.keys[0] <= chave_min:
-            return False
-        if chave_max is not None and no.keys[-1] >= chave_max:
-            return False
-
-        if not no.leaf:
-            if len(no.children) != len(no.keys) + 1:
-                return False
-
-            for i, filho in enumerate(no.children):
-                filho_min = no.keys[i - 1] if i > 0 else chave_min
-                filho_max = no.keys[i] if i < len(no.keys) else chave_max
-
-                if not self._validate_node(filho, filho_min, filho_max, altura_esperada - 1):
-                    return False
-        else:
-            if altura_esperada != 1:
-                return False
-
-        return True
+        return self.validate_report().valid
+
+    def validate_report(self, sample: Optional[int] = None, incremental: bool = False,
+                        seed: Optional[int] = None) -> ValidationReport:
+        if incremental:
+            if self._tocados is None:
+                self._tocados = set()
+                return validate_tree(self)
+            tocados, self._tocados = self._tocados, set()
+            return validate_incremental(self, tocados)
+        if sample is not None:
+            return validate_sampled(self, sample, seed)
+        return validate_tree(self)
@@ -0,0 +1,333 @@
+import heapq
+import math
+import os
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+from xml.sax.saxutils import escape
+
+from .btree import BTree, BNode
+from .layout import ALTURA_NIVEL, ESPACAMENTO_MIN_NO, MARGEM_TOPO, get_node_bounds
+
+ALTURA_NO = 56
+RAIO_NO = 12
+LARGURA_MIN_NO = 120
+LARGURA_CHAVE = 40
+INICIO_ARESTA = 35
+FIM_ARESTA = 15
+
+COR_FUNDO = "#0a0a0a"
+COR_NO = "#18181b"
+COR_BORDA = "#27272a"
+COR_ARESTA = "#52525b"
+COR_TEXTO = "#ffffff"
+COR_CHEIO = "#1e40af"
+COR_FOLHA = "#065f46"
+COR_INTERNO = "#92400e"
+CORES_NIVEIS = ("#1e3a8a", "#4c1d95", "#831843", "#7c2d12", "#365314", "#134e4a")
+
+PREENCHIMENTOS = ("none", "occupancy", "leaf", "level")
+BLOCO_ESCRITA = 4096
+
+Preenchimento = Union[str, Callable[[Dict[str, Any]], str], None]
+
+
+def node_width(chaves: int) -> float:
+    return max(LARGURA_MIN_NO, chaves * LARGURA_CHAVE + 32)
+
+
+def _leaf_counts(raiz: BNode) -> Dict[str, int]:
+    contagens: Dict[str, int] = {}
+    pilha = [(raiz, False)]
+
+    while pilha:
+        no, visitado = pilha.pop()
+        if no.leaf:
+            continue
+        if visitado:
+            contagens[no.id] = max(sum(contagens.get(filho.id, 1) for filho in no.children), 1)
+        else:
+            pilha.append((no, True))
+            pilha.extend((filho, False) for filho in no.children if not filho.leaf)
+
+    return contagens
+
+
+Frente = List[Tuple[BNode, int, Optional[Tuple[float, float]]]]
+
+
+def _stream_levels(raiz: BNode, contagens: Dict[str, int],
+                   max_levels: Optional[int]) -> Iterator[Tuple[int, float, Frente]]:
+    nivel: Frente = [(raiz, 0, None)]
+    indice_nivel = 0
+
+    while nivel and (max_levels is None or indice_nivel < max_levels):
+        y = indice_nivel * ALTURA_NIVEL + MARGEM_TOPO
+        yield indice_nivel, y, nivel
+
+        proximo: Frente = []
+        for no, inicio, _ in nivel:
+            if no.leaf:
+                continue
+            posicao = (_x(raiz, contagens, no, inicio), y)
+            for filho in no.children:
+                proximo.append((filho, inicio, posicao))
+                inicio += contagens.get(filho.id, 1)
+
+        nivel = proximo
+        indice_nivel += 1
+
+
+def _x(raiz: BNode, contagens: Dict[str, int], no: BNode, inicio: int) -> float:
+    largura_total = contagens.get(raiz.id, 1)
+    return (inicio + contagens.get(no.id, 1) / 2 - largura_total / 2) * ESPACAMENTO_MIN_NO
+
+
+def _node_dict(raiz: BNode, contagens: Dict[str, int], no: BNode, inicio: int,
+               pai: Optional[Tuple[float, float]], indice_nivel: int, y: float) -> Dict[str, Any]:
+    return {
+        "id": no.id,
+        "keys": no.keys.copy(),
+        "x": _x(raiz, contagens, no, inicio),
+        "y": y,
+        "isLeaf": no.leaf,
+        "level": indice_nivel,
+        "parent": pai
+    }
+
+
+def iter_levels(arvore: BTree, max_levels: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+    if not arvore.root:
+        return
+
+    raiz = arvore.root
+    contagens = _leaf_counts(raiz)
+    for indice_nivel, y, nivel in _stream_levels(raiz, contagens, max_levels):
+        yield [_node_dict(raiz, contagens, no, inicio, pai, indice_nivel, y)
+               for no, inicio, pai in nivel]
+
+
+def _frame(arvore: BTree, contagens: Dict[str, int],
+           max_levels: Optional[int]) -> Tuple[Dict[str, float], int]:
+    largura_total = contagens.get(arvore.root.id, 1) * ESPACAMENTO_MIN_NO
+    esquerda, direita = arvore.root, arvore.root
+    inicio_direita = 0
+    niveis = 1
+
+    while not esquerda.leaf and (max_levels is None or niveis < max_levels):
+        esquerda = esquerda.children[0]
+        inicio_direita += sum(contagens.get(filho.id, 1) for filho in direita.children[:-1])
+        direita = direita.children[-1]
+        niveis += 1
+
+    y = (niveis - 1) * ALTURA_NIVEL + MARGEM_TOPO
+    largura_direita = contagens.get(direita.id, 1)
+    extremos = [
+        {"x": 0, "y": MARGEM_TOPO},
+        {"x": -largura_total / 2 + contagens.get(esquerda.id, 1) * ESPACAMENTO_MIN_NO / 2, "y": y},
+        {"x": -largura_total / 2 + (inicio_direita + largura_direita / 2) * ESPACAMENTO_MIN_NO, "y": y}
+    ]
+    limites = get_node_bounds(extremos)
+    margem = node_width(arvore._max_keys) / 2
+    limites["minX"] = min(limites["minX"], extremos[1]["x"] - margem)
+    limites["maxX"] = max(limites["maxX"], extremos[2]["x"] + margem)
+    return limites, niveis
+
+
+def _resolve_fill(preenchimento: Preenchimento, max_chaves: int) -> Callable[[Dict[str, Any]], str]:
+    if callable(preenchimento):
+        return preenchimento
+    if preenchimento in (None, "none"):
+        return lambda no: COR_NO
+    if preenchimento == "leaf":
+        return lambda no: COR_FOLHA if no["isLeaf"] else COR_INTERNO
+    if preenchimento == "level":
+        return lambda no: CORES_NIVEIS[no["level"] % len(CORES_NIVEIS)]
+    if preenchimento == "occupancy":
+        return lambda no: _mix(COR_NO, COR_CHEIO, len(no["keys"]) / max_chaves)
+    raise ValueError(f"Preenchimento desconhecido: {preenchimento}")
+
+
+def _mix(cor_a: str, cor_b: str, proporcao: float) -> str:
+    proporcao = min(max(proporcao, 0.0), 1.0)
+    canais = []
+    for i in (1, 3, 5):
+        a = int(cor_a[i:i + 2], 16)
+        b = int(cor_b[i:i + 2], 16)
+        canais.append(round(a + (b - a) * proporcao))
+    return "#{:02x}{:02x}{:02x}".format(*canais)
+
+
+def _label(chaves: List[int]) -> str:
+    return " ".join(str(chave) for chave in chaves)
+
+
+def write_svg(arvore: BTree, destino: Union[str, TextIO], max_levels: Optional[int] = None,
+              fill: Preenchimento = None, show_keys: bool = True) -> Dict[str, Any]:
+    if isinstance(destino, str):
+        if destino == "-":
+            return write_svg(arvore, sys.stdout, max_levels, fill, show_keys)
+        with open(destino, "w", encoding="utf-8") as arquivo:
+            return write_svg(arvore, arquivo, max_levels, fill, show_keys)
+
+    cor = _resolve_fill(fill, arvore._max_keys)
+    if arvore.root:
+        contagens = _leaf_counts(arvore.root)
+        limites, _ = _frame(arvore, contagens, max_levels)
+    else:
+        contagens = {}
+        limites = get_node_bounds([])
+
+    largura = limites["maxX"] - limites["minX"]
+    altura = limites["maxY"] - limites["minY"]
+    destino.write(
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{largura:.0f}" height="{altura:.0f}" '
+        f'viewBox="{limites["minX"]:.1f} {limites["minY"]:.1f} {largura:.1f} {altura:.1f}">\n'
+        f'<rect x="{limites["minX"]:.1f}" y="{limites["minY"]:.1f}" width="{largura:.1f}" '
+        f'height="{altura:.1f}" fill="{COR_FUNDO}"/>\n'
+    )
+
+    niveis = 0
+    total = 0
+    if arvore.root:
+        raiz = arvore.root
+        for indice_nivel, y, nivel in _stream_levels(raiz, contagens, max_levels):
+            destino.write(f'<g id="level-{indice_nivel}">\n')
+
+            if indice_nivel:
+                destino.write(f'<g stroke="{COR_ARESTA}" stroke-width="2.5" stroke-linecap="round">\n')
+                partes = []
+                for no, inicio, (pai_x, pai_y) in nivel:
+                    partes.append(f'<line x1="{pai_x:.1f}" y1="{pai_y + INICIO_ARESTA:.1f}" '
+                                  f'x2="{_x(raiz, contagens, no, inicio):.1f}" '
+                                  f'y2="{y - FIM_ARESTA:.1f}"/>\n')
+                    if len(partes) >= BLOCO_ESCRITA:
+                        destino.write("".join(partes))
+                        partes = []
+                destino.write("".join(partes))
+                destino.write("</g>\n")
+
+            destino.write(f'<g stroke="{COR_BORDA}" stroke-width="2" font-family="sans-serif" '
+                          f'font-size="13" text-anchor="middle">\n')
+            partes = []
+            for no, inicio, pai in nivel:
+                dados = _node_dict(raiz, contagens, no, inicio, pai, indice_nivel, y)
+                largura_no = node_width(len(no.keys))
+                partes.append(f'<rect x="{dados["x"] - largura_no / 2:.1f}" y="{y - ALTURA_NO / 2:.1f}" '
+                              f'width="{largura_no:.0f}" height="{ALTURA_NO}" rx="{RAIO_NO}" '
+                              f'fill="{cor(dados)}"/>\n')
+                if show_keys and no.keys:
+                    partes.append(f'<text x="{dados["x"]:.1f}" y="{y + 5:.1f}" stroke="none" '
+                                  f'fill="{COR_TEXTO}">{escape(_label(no.keys))}</text>\n')
+                if len(partes) >= BLOCO_ESCRITA:
+                    destino.write("".join(partes))
+                    partes = []
+            destino.write("".join(partes))
+            destino.write("</g>\n</g>\n")
+
+            niveis += 1
+            total += len(nivel)
+
+    destino.write("</svg>\n")
+    return {"format": "svg", "levels": niveis, "nodes": total, "bounds": limites}
+
+
+def write_png_tiles(arvore: BTree, diretorio: str, tile_size: int = 2048, scale: float = 1.0,
+                    max_levels: Optional[int] = None, fill: Preenchimento = None,
+                    show_keys: bool = True) -> Dict[str, Any]:
+    try:
+        from PySide6.QtCore import QPointF, QRectF, Qt
+        from PySide6.QtGui import QColor, QFont, QGuiApplication, QImage, QPainter, QPen
+    except ImportError:
+        raise RuntimeError("A exportação PNG precisa do PySide6 instalado") from None
+
+    if tile_size < 1 or scale <= 0:
+        raise ValueError("Tamanho do tile e escala devem ser positivos")
+
+    if QGuiApplication.instance() is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        _aplicacao = QGuiApplication([])
+
+    os.makedirs(diretorio, exist_ok=True)
+    resumo = {"format": "png", "levels": 0, "nodes": 0, "tiles": 0, "directory": diretorio}
+    if not arvore.root:
+        return resumo
+
+    cor = _resolve_fill(fill, arvore._max_keys)
+    contagens = _leaf_counts(arvore.root)
+    limites, _ = _frame(arvore, contagens, max_levels)
+
+    passo = tile_size / scale
+    colunas = max(1, math.ceil((limites["maxX"] - limites["minX"]) / passo))
+    altura_tile = max(1, round(ALTURA_NIVEL * scale))
+    margem = node_width(arvore._max_keys) / 2
+
+    fonte = QFont("sans-serif")
+    fonte.setPixelSize(13)
+    caneta_aresta = QPen(QColor(COR_ARESTA), 2.5)
+    caneta_aresta.setCapStyle(Qt.RoundCap)
+    caneta_borda = QPen(QColor(COR_BORDA), 2)
+    caneta_texto = QPen(QColor(COR_TEXTO))
+
+    raiz = arvore.root
+    for indice_nivel, y, nivel in _stream_levels(raiz, contagens, max_levels):
+        topo = y - ALTURA_NIVEL + INICIO_ARESTA
+        intervalos = []
+        for indice, (no, inicio, pai) in enumerate(nivel):
+            x = _x(raiz, contagens, no, inicio)
+            pai_x = pai[0] if pai else x
+            intervalos.append((min(pai_x, x) - margem, max(pai_x, x) + margem, indice))
+        intervalos.sort()
+
+        ativos: List[Tuple[float, int]] = []
+        ponteiro = 0
+        for coluna in range(colunas):
+            x0 = limites["minX"] + coluna * passo
+            x1 = x0 + passo
+            while ponteiro < len(intervalos) and intervalos[ponteiro][0] <= x1:
+                heapq.heappush(ativos, (intervalos[ponteiro][1], intervalos[ponteiro][2]))
+                ponteiro += 1
+            while ativos and ativos[0][0] < x0:
+                heapq.heappop(ativos)
+            if not ativos:
+                continue
+
+            visiveis = [_node_dict(raiz, contagens, *nivel[indice], indice_nivel, y)
+                        for indice in sorted(indice for _, indice in ativos)]
+            imagem = QImage(tile_size, altura_tile, QImage.Format_ARGB32)
+            imagem.fill(QColor(COR_FUNDO))
+
+            pintor = QPainter(imagem)
+            pintor.setRenderHint(QPainter.Antialiasing)
+            pintor.scale(scale, scale)
+            pintor.translate(-x0, -topo)
+            pintor.setFont(fonte)
+
+            pintor.setPen(caneta_aresta)
+            for no in visiveis:
+                if no["parent"]:
+                    pai_x, pai_y = no["parent"]
+                    pintor.drawLine(QPointF(pai_x, pai_y + INICIO_ARESTA),
+                                    QPointF(no["x"], y - FIM_ARESTA))
+
+            for no in visiveis:
+                largura_no = node_width(len(no["keys"]))
+                retangulo = QRectF(no["x"] - largura_no / 2, y - ALTURA_NO / 2, largura_no, ALTURA_NO)
+                pintor.setPen(caneta_borda)
+                pintor.setBrush(QColor(cor(no)))
+                pintor.drawRoundedRect(retangulo, RAIO_NO, RAIO_NO)
+                if show_keys and no["keys"]:
+                    pintor.setPen(caneta_texto)
+                    pintor.drawText(retangulo, Qt.AlignCenter, _label(no["keys"]))
+            pintor.end()
+
+            caminho = os.path.join(diretorio, f"tile_{indice_nivel:03d}_{coluna:05d}.png")
+            if not imagem.save(caminho):
+                raise OSError(f"Não foi possível gravar {caminho}")
+            resumo["tiles"] += 1
+
+        resumo["levels"] += 1
+        resumo["nodes"] += len(nivel)
+
+    resumo["columns"] = colunas
+    resumo["tileHeight"] = altura_tile
+    return resumo
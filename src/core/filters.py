@@ -0,0 +1,223 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+MASCARA_64 = (1 << 64) - 1
+CONTADOR_MAXIMO = 255
+BITS_MAXIMOS_BITMAP = 1 << 30
+
+
+def _mix64(chave: int) -> int:
+    z = (chave + 0x9E3779B97F4A7C15) & MASCARA_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASCARA_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASCARA_64
+    return z ^ (z >> 31)
+
+
+class MembershipFilter(ABC):
+
+    name = "filter"
+
+    def __init__(self):
+        self.items: int = 0
+        self.queries: int = 0
+        self.definite_misses: int = 0
+        self.false_positives: int = 0
+
+    def covers(self, chave: int) -> bool:
+        return True
+
+    def might_contain(self, chave: int) -> bool:
+        if not self.covers(chave):
+            return True
+        self.queries += 1
+        if self._contains(chave):
+            return True
+        self.definite_misses += 1
+        return False
+
+    def record_false_positive(self):
+        self.false_positives += 1
+
+    def needs_rebuild(self) -> bool:
+        return False
+
+    def rebuild(self, chaves: Iterable[int]):
+        self.clear()
+        for chave in chaves:
+            self.add(chave)
+
+    @abstractmethod
+    def _contains(self, chave: int) -> bool:
+        ...
+
+    @abstractmethod
+    def add(self, chave: int):
+        ...
+
+    @abstractmethod
+    def remove(self, chave: int):
+        ...
+
+    def clear(self):
+        self.items = 0
+
+    @abstractmethod
+    def memory_bytes(self) -> int:
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        ausentes = self.definite_misses + self.false_positives
+        return {
+            "type": self.name,
+            "items": self.items,
+            "queries": self.queries,
+            "definiteMisses": self.definite_misses,
+            "falsePositives": self.false_positives,
+            "falsePositiveRate": self.false_positives / ausentes if ausentes else 0.0,
+            "memoryBytes": self.memory_bytes()
+        }
+
+
+class CountingBloomFilter(MembershipFilter):
+
+    name = "bloom"
+
+    def __init__(self, capacity: int = 1024, fp_rate: float = 0.01):
+        super().__init__()
+        if capacity < 1:
+            raise ValueError("A capacidade do filtro deve ser pelo menos 1")
+        if not 0 < fp_rate < 1:
+            raise ValueError("A taxa de falsos positivos deve estar entre 0 e 1")
+
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self._configure()
+
+    def _configure(self):
+        self._tamanho = max(8, int(-self.capacity * math.log(self.fp_rate) / (math.log(2) ** 2)))
+        self._funcoes = max(1, round(self._tamanho / self.capacity * math.log(2)))
+        self._contadores = bytearray(self._tamanho)
+
+    def _positions(self, chave: int):
+        z = _mix64(chave & MASCARA_64)
+        h1 = z & 0xFFFFFFFF
+        h2 = (z >> 32) | 1
+        tamanho = self._tamanho
+        return [(h1 + i * h2) % tamanho for i in range(self._funcoes)]
+
+    def _contains(self, chave: int) -> bool:
+        z = _mix64(chave & MASCARA_64)
+        posicao = z & 0xFFFFFFFF
+        passo = (z >> 32) | 1
+        tamanho = self._tamanho
+        contadores = self._contadores
+        for _ in range(self._funcoes):
+            if not contadores[posicao % tamanho]:
+                return False
+            posicao += passo
+        return True
+
+    def add(self, chave: int):
+        contadores = self._contadores
+        for posicao in self._positions(chave):
+            if contadores[posicao] < CONTADOR_MAXIMO:
+                contadores[posicao] += 1
+        self.items += 1
+
+    def remove(self, chave: int):
+        contadores = self._contadores
+        for posicao in self._positions(chave):
+            if 0 < contadores[posicao] < CONTADOR_MAXIMO:
+                contadores[posicao] -= 1
+        self.items -= 1
+
+    def clear(self):
+        super().clear()
+        self._contadores = bytearray(self._tamanho)
+
+    def needs_rebuild(self) -> bool:
+        return self.items > self.capacity
+
+    def rebuild(self, chaves: Iterable[int]):
+        chaves = list(chaves)
+        self.capacity = max(self.capacity, len(chaves)) * 2
+        self._configure()
+        self.items = 0
+        for chave in chaves:
+            self.add(chave)
+
+    def memory_bytes(self) -> int:
+        return len(self._contadores)
+
+    def stats(self) -> Dict[str, Any]:
+        dados = super().stats()
+        ocupacao = 1 - math.exp(-self._funcoes * self.items / self._tamanho)
+        dados.update({
+            "capacity": self.capacity,
+            "hashes": self._funcoes,
+            "counters": self._tamanho,
+            "expectedFalsePositiveRate": ocupacao ** self._funcoes
+        })
+        return dados
+
+
+class BitmapFilter(MembershipFilter):
+
+    name = "bitmap"
+
+    def __init__(self, low: int, high: int):
+        super().__init__()
+        if high < low:
+            raise ValueError("O intervalo do bitmap é inválido")
+        if high - low + 1 > BITS_MAXIMOS_BITMAP:
+            raise ValueError(f"O intervalo do bitmap excede {BITS_MAXIMOS_BITMAP} chaves")
+        self.low = low
+        self.high = high
+        self._bits = bytearray((high - low) // 8 + 1)
+
+    def covers(self, chave: int) -> bool:
+        return self.low <= chave <= self.high
+
+    def _contains(self, chave: int) -> bool:
+        if chave < self.low or chave > self.high:
+            return True
+        deslocamento = chave - self.low
+        return bool(self._bits[deslocamento >> 3] & (1 << (deslocamento & 7)))
+
+    def add(self, chave: int):
+        self.items += 1
+        if self.low <= chave <= self.high:
+            deslocamento = chave - self.low
+            self._bits[deslocamento >> 3] |= 1 << (deslocamento & 7)
+
+    def remove(self, chave: int):
+        self.items -= 1
+        if self.low <= chave <= self.high:
+            deslocamento = chave - self.low
+            self._bits[deslocamento >> 3] &= ~(1 << (deslocamento & 7)) & 0xFF
+
+    def clear(self):
+        super().clear()
+        self._bits = bytearray(len(self._bits))
+
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    def stats(self) -> Dict[str, Any]:
+        dados = super().stats()
+        dados["range"] = [self.low, self.high]
+        return dados
+
+
+def make_filter(especificacao: Union[str, MembershipFilter],
+                intervalo: Optional[Tuple[int, int]] = None) -> MembershipFilter:
+    if isinstance(especificacao, MembershipFilter):
+        return especificacao
+    if especificacao == "bloom":
+        return CountingBloomFilter()
+    if especificacao == "bitmap":
+        if intervalo is None:
+            raise ValueError("O filtro bitmap precisa de um intervalo de chaves")
+        return BitmapFilter(*intervalo)
+    raise ValueError(f"Filtro desconhecido: {especificacao}")
@@ -0,0 +1,135 @@
+import sys
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, TextIO, Tuple
+
+FORMATOS = ("auto", "lines", "csv", "int64")
+EXTENSOES_BINARIAS = (".bin", ".i64", ".int64")
+TAMANHO_INT64 = 8
+TAMANHO_LEITURA = 1 << 16
+
+
+def detect_format(caminho: str, formato: str = "auto") -> str:
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconhecido: {formato}")
+    if formato != "auto":
+        return formato
+    if caminho == "-":
+        return "lines"
+
+    sufixo = Path(caminho).suffix.lower()
+    if sufixo in EXTENSOES_BINARIAS:
+        return "int64"
+    if sufixo == ".csv":
+        return "csv"
+    return "lines"
+
+
+def iter_key_chunks(caminho: str, formato: str = "auto",
+                    tamanho_bloco: int = 4096) -> Iterator[List[int]]:
+    if tamanho_bloco < 1:
+        raise ValueError("O tamanho do bloco deve ser pelo menos 1")
+
+    formato = detect_format(caminho, formato)
+
+    if formato == "int64":
+        if caminho == "-":
+            yield from _read_int64(sys.stdin.buffer, tamanho_bloco)
+        else:
+            with open(caminho, "rb") as arquivo:
+                yield from _read_int64(arquivo, tamanho_bloco)
+        return
+
+    if caminho == "-":
+        yield from _read_text(sys.stdin, formato, tamanho_bloco)
+    else:
+        with open(caminho, "r", encoding="utf-8") as arquivo:
+            yield from _read_text(arquivo, formato, tamanho_bloco)
+
+
+def iter_keys(caminhos: Iterable[str], formato: str = "auto",
+              tamanho_bloco: int = 4096) -> Iterator[List[int]]:
+    for caminho in caminhos:
+        yield from iter_key_chunks(caminho, formato, tamanho_bloco)
+
+
+def _iter_fields(arquivo: TextIO, formato: str) -> Iterator[Tuple[int, str]]:
+    numero_linha = 1
+    inicio_linha = True
+    comentario = False
+    resto = ""
+
+    while True:
+        dados = arquivo.read(TAMANHO_LEITURA)
+        texto = resto + dados
+
+        if dados:
+            corte = texto.rfind("\n")
+            if formato == "csv":
+                corte = max(corte, texto.rfind(","))
+            if corte < 0:
+                resto = texto
+                continue
+            texto, resto = texto[:corte + 1], texto[corte + 1:]
+
+        for indice, linha in enumerate(texto.split("\n")):
+            if indice:
+                numero_linha += 1
+                inicio_linha = True
+                comentario = False
+
+            campos = linha.split(",") if formato == "csv" else [linha]
+            for campo in campos:
+                campo = campo.strip()
+                if not campo or comentario:
+                    continue
+                if inicio_linha and campo.startswith("#"):
+                    comentario = True
+                    continue
+                inicio_linha = False
+                yield numero_linha, campo
+
+        if not dados:
+            return
+
+
+def _read_text(arquivo: TextIO, formato: str, tamanho_bloco: int) -> Iterator[List[int]]:
+    bloco = []
+
+    for numero_linha, campo in _iter_fields(arquivo, formato):
+        try:
+            bloco.append(int(campo))
+        except ValueError:
+            raise ValueError(f"Chave inválida na linha {numero_linha}: {campo!r}") from None
+
+        if len(bloco) >= tamanho_bloco:
+            yield bloco
+            bloco = []
+
+    if bloco:
+        yield bloco
+
+
+def _read_int64(arquivo: BinaryIO, tamanho_bloco: int) -> Iterator[List[int]]:
+    tamanho_leitura = tamanho_bloco * TAMANHO_INT64
+    resto = b""
+
+    while True:
+        dados = arquivo.read(tamanho_leitura)
+        if not dados:
+            break
+
+        dados = resto + dados
+        corte = len(dados) - len(dados) % TAMANHO_INT64
+        resto = dados[corte:]
+
+        valores = array("q")
+        valores.frombytes(dados[:corte])
+        if sys.byteorder == "big":
+            valores.byteswap()
+        if valores:
+            yield valores.tolist()
+
+    if resto:
+        raise ValueError(f"Arquivo binário truncado: {len(resto)} byte(s) sobrando")
+
@@ -0,0 +1,298 @@
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+OPERACOES = ("insert", "delete", "search")
+DESCIDAS = ("_insert_key", "_delete_key")
+EVENTOS_ESTRUTURAIS = (
+    "_split_child",
+    "_split_two_to_three",
+    "_split_rightmost",
+    "_try_compact_siblings",
+    "_redistribute_between_siblings",
+    "_fill_child",
+    "_merge_children",
+    "_borrow_from_prev",
+    "_borrow_from_next",
+)
+DIVISOES = ("split_child", "split_two_to_three", "split_rightmost")
+SUB_BUCKETS = 4
+JANELA_PADRAO = 5.0
+RESOLUCAO_JANELA = 0.1
+
+
+class LatencyHistogram:
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+
+    def record(self, ns: int):
+        if ns < SUB_BUCKETS:
+            indice = ns
+        else:
+            bit = ns.bit_length() - 1
+            indice = bit * SUB_BUCKETS + ((ns >> (bit - 2)) & (SUB_BUCKETS - 1))
+
+        self.buckets[indice] = self.buckets.get(indice, 0) + 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def merge(self, outro: "LatencyHistogram"):
+        for indice, quantidade in outro.buckets.items():
+            self.buckets[indice] = self.buckets.get(indice, 0) + quantidade
+        self.count += outro.count
+        self.total_ns += outro.total_ns
+        self.max_ns = max(self.max_ns, outro.max_ns)
+
+    def percentile(self, p: float) -> int:
+        if not self.count:
+            return 0
+
+        alvo = p / 100 * self.count
+        acumulado = 0
+        for indice in sorted(self.buckets):
+            acumulado += self.buckets[indice]
+            if acumulado >= alvo:
+                return min(self._upper_bound(indice), self.max_ns)
+        return self.max_ns
+
+    def _upper_bound(self, indice: int) -> int:
+        if indice < SUB_BUCKETS:
+            return indice + 1
+        bit, sub = divmod(indice, SUB_BUCKETS)
+        return (SUB_BUCKETS + sub + 1) << (bit - 2)
+
+    def to_dict(self) -> Dict[str, float]:
+        media = self.total_ns / self.count if self.count else 0
+        return {
+            "count": self.count,
+            "totalMs": self.total_ns / 1e6,
+            "meanUs": media / 1e3,
+            "p50Us": self.percentile(50) / 1e3,
+            "p90Us": self.percentile(90) / 1e3,
+            "p99Us": self.percentile(99) / 1e3,
+            "maxUs": self.max_ns / 1e3
+        }
+
+
+class Instrumentation:
+
+    def __init__(self, window: Optional[float] = JANELA_PADRAO):
+        if window is not None and window <= 0:
+            raise ValueError("A janela de medição deve ser positiva")
+        self.window = window
+        self.counters: Dict[str, int] = {}
+        self.latencies: Dict[str, LatencyHistogram] = {}
+        self.depths: Dict[str, Dict[int, int]] = {}
+        self.capture_result: Optional[Dict[str, Any]] = None
+        self._arvore = None
+        self._pilha: List[str] = []
+        self._descidas: int = 0
+        self._baldes: Deque[List[Any]] = deque()
+        self._inicio = time.perf_counter()
+
+    def attach(self, arvore):
+        if self._arvore is not None:
+            raise RuntimeError("Instrumentação já está associada a uma árvore")
+
+        self._arvore = arvore
+        self._inicio = time.perf_counter()
+        for nome in OPERACOES:
+            setattr(arvore, nome, self._wrap_operation(nome, getattr(arvore, nome)))
+        for nome in DESCIDAS:
+            setattr(arvore, nome, self._wrap_descent(getattr(arvore, nome)))
+        for nome in EVENTOS_ESTRUTURAIS:
+            setattr(arvore, nome, self._wrap_event(nome.lstrip("_"), getattr(arvore, nome)))
+
+    def detach(self):
+        if self._arvore is None:
+            return
+
+        for nome in OPERACOES + DESCIDAS + EVENTOS_ESTRUTURAIS:
+            self._arvore.__dict__.pop(nome, None)
+        self._arvore = None
+        self._pilha = []
+
+    def reset(self):
+        self.counters = {}
+        self.latencies = {}
+        self.depths = {}
+        self.capture_result = None
+        self._baldes = deque()
+        self._inicio = time.perf_counter()
+
+    def _record(self, nome: str, ns: int):
+        self.counters[nome] = self.counters.get(nome, 0) + 1
+        histograma = self.latencies.get(nome)
+        if histograma is None:
+            histograma = self.latencies[nome] = LatencyHistogram()
+        histograma.record(ns)
+
+        if self.window is not None and (nome in OPERACOES or nome in DIVISOES):
+            self._mark_window(nome, ns)
+
+    def _mark_window(self, nome: str, ns: int):
+        balde = int(time.perf_counter() / RESOLUCAO_JANELA)
+
+        if not self._baldes or self._baldes[-1][0] != balde:
+            self._baldes.append([balde, 0, 0, {}])
+            limite = balde - int(self.window / RESOLUCAO_JANELA) - 1
+            while self._baldes[0][0] < limite:
+                self._baldes.popleft()
+
+        atual = self._baldes[-1]
+        if nome in DIVISOES:
+            atual[2] += 1
+            return
+
+        atual[1] += 1
+        histograma = atual[3].get(nome)
+        if histograma is None:
+            histograma = atual[3][nome] = LatencyHistogram()
+        histograma.record(ns)
+
+    def _record_depth(self, nome: str, profundidade: int):
+        profundidades = self.depths.setdefault(nome, {})
+        profundidades[profundidade] = profundidades.get(profundidade, 0) + 1
+
+    def _wrap_operation(self, nome: str, metodo: Callable) -> Callable:
+        relogio = time.perf_counter_ns
+
+        def medido(*args, **kwargs):
+            if self._pilha:
+                fase = f"{self._pilha[-1]}.{nome}"
+            else:
+                fase = nome
+                self._descidas = 0
+
+            self._pilha.append(fase)
+            inicio = relogio()
+            try:
+                resultado = metodo(*args, **kwargs)
+            finally:
+                duracao = relogio() - inicio
+                self._pilha.pop()
+            self._record(fase, duracao)
+
+            if fase == "search":
+                self._record_depth(fase, len(resultado[2]))
+            elif fase in ("insert", "delete") and self._descidas:
+                self._record_depth(fase, self._descidas)
+            return resultado
+
+        return medido
+
+    def _wrap_descent(self, metodo: Callable) -> Callable:
+
+        def contado(*args, **kwargs):
+            self._descidas += 1
+            return metodo(*args, **kwargs)
+
+        return contado
+
+    def _wrap_event(self, nome: str, metodo: Callable) -> Callable:
+        relogio = time.perf_counter_ns
+
+        def medido(*args, **kwargs):
+            inicio = relogio()
+            resultado = metodo(*args, **kwargs)
+            self._record(nome, relogio() - inicio)
+            return resultado
+
+        return medido
+
+    @contextmanager
+    def capture(self, cprofile: bool = True, memoria: bool = False,
+                limite: int = 20) -> Iterator["Instrumentation"]:
+        perfil = cProfile.Profile() if cprofile else None
+        rastreando = memoria and not tracemalloc.is_tracing()
+
+        if rastreando:
+            tracemalloc.start()
+        if memoria:
+            tracemalloc.reset_peak()
+            memoria_inicial, _ = tracemalloc.get_traced_memory()
+        if perfil:
+            perfil.enable()
+
+        try:
+            yield self
+        finally:
+            if perfil:
+                perfil.disable()
+
+            resultado = {}
+            if perfil:
+                saida = io.StringIO()
+                pstats.Stats(perfil, stream=saida).sort_stats("cumulative").print_stats(limite)
+                resultado["cprofile"] = saida.getvalue()
+            if memoria:
+                atual, pico = tracemalloc.get_traced_memory()
+                resultado["memory"] = {
+                    "allocatedBytes": atual - memoria_inicial,
+                    "peakBytes": pico - memoria_inicial
+                }
+                if rastreando:
+                    tracemalloc.stop()
+            self.capture_result = resultado
+
+    def summary(self) -> Dict[str, float]:
+        operacoes = sum(self.counters.get(nome, 0) for nome in OPERACOES)
+        divisoes = sum(self.counters.get(nome, 0) for nome in DIVISOES)
+
+        agora = time.perf_counter()
+        decorrido = agora - self._inicio
+        if self.window is None:
+            operacoes_janela, divisoes_janela, segundos = operacoes, divisoes, decorrido
+            latencias = self.latencies
+        else:
+            limite = (agora - self.window) / RESOLUCAO_JANELA - 1
+            recentes = [balde for balde in self._baldes if balde[0] > limite]
+            operacoes_janela = sum(balde[1] for balde in recentes)
+            divisoes_janela = sum(balde[2] for balde in recentes)
+            segundos = min(self.window, decorrido)
+
+            latencias: Dict[str, LatencyHistogram] = {}
+            for balde in recentes:
+                for nome, histograma in balde[3].items():
+                    latencias.setdefault(nome, LatencyHistogram()).merge(histograma)
+
+        pior_p99 = max((latencias[nome].percentile(99) for nome in OPERACOES
+                        if nome in latencias), default=0)
+
+        return {
+            "operations": operacoes,
+            "splits": divisoes,
+            "windowSeconds": segundos,
+            "opsPerSec": operacoes_janela / segundos if segundos else 0.0,
+            "splitsPerSec": divisoes_janela / segundos if segundos else 0.0,
+            "p99Us": pior_p99 / 1e3
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        dados = {
+            "summary": self.summary(),
+            "operations": {nome: self.counters[nome] for nome in OPERACOES if nome in self.counters},
+            "events": {nome.lstrip("_"): self.counters[nome.lstrip("_")] for nome in EVENTOS_ESTRUTURAIS
+                       if nome.lstrip("_") in self.counters},
+            "latency": {nome: histograma.to_dict() for nome, histograma in self.latencies.items()},
+            "depth": {nome: {str(p): n for p, n in sorted(profundidades.items())}
+                      for nome, profundidades in self.depths.items()}
+        }
+        if self.capture_result is not None:
+            dados["capture"] = self.capture_result
+        return dados
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
@@ -1,6 +1,10 @@
 from typing import List, Dict, Any, Tuple
 from .btree import BTree, BNode
 
+ALTURA_NIVEL = 120
+ESPACAMENTO_MIN_NO = 150
+MARGEM_TOPO = 50
+
 
 def layout(arvore: BTree) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     if not arvore.root:
@@ -38,13 +42,10 @@ def _build_level_data(raiz: BNode) -> List[List[BNode]]:
 def _assign_positions(niveis: List[List[BNode]], 
                      nos: List[Dict[str, Any]], 
                      arestas: List[Dict[str, Any]]):
-    ALTURA_NIVEL = 120
-    ESPACAMENTO_MIN_NO = 150 
-
     larguras_subarvores = _calculate_subtree_widths(niveis)
 
     for indice_nivel, nivel in enumerate(niveis):
-        y = indice_nivel * ALTURA_NIVEL + 50 
+        y = indice_nivel * ALTURA_NIVEL + MARGEM_TOPO
 
         largura_total = 0
         for no in nivel:
@@ -0,0 +1,43 @@
+from typing import Any, Dict, List, Union
+
+
+class SplitPolicy:
+
+    name = "classic"
+
+    def handle_overflow(self, arvore, pai, indice: int, eventos: List[Dict[str, Any]]):
+        arvore._split_child(pai, indice, eventos)
+
+    def handle_underflow(self, arvore, pai, indice: int, eventos: List[Dict[str, Any]]):
+        arvore._fill_child(pai, indice, eventos)
+
+
+class RedistributePolicy(SplitPolicy):
+
+    name = "redistribute"
+
+    def handle_overflow(self, arvore, pai, indice: int, eventos: List[Dict[str, Any]]):
+        if not arvore._try_compact_siblings(pai, indice, eventos):
+            arvore._split_child(pai, indice, eventos)
+
+
+class BStarPolicy(SplitPolicy):
+
+    name = "bstar"
+
+    def handle_overflow(self, arvore, pai, indice: int, eventos: List[Dict[str, Any]]):
+        if not arvore._try_compact_siblings(pai, indice, eventos):
+            arvore._split_two_to_three(pai, indice, eventos)
+
+
+POLITICAS: Dict[str, type] = {
+    politica.name: politica for politica in (SplitPolicy, RedistributePolicy, BStarPolicy)
+}
+
+
+def get_policy(politica: Union[str, SplitPolicy]) -> SplitPolicy:
+    if isinstance(politica, SplitPolicy):
+        return politica
+    if politica not in POLITICAS:
+        raise ValueError(f"Política de divisão desconhecida: {politica}")
+    return POLITICAS[politica]()
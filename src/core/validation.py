@@ -0,0 +1,179 @@
+import random
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+Violacao = Optional[Tuple[str, str]]
+
+
+class ValidationReport:
+
+    def __init__(self, valid: bool = True, rule: Optional[str] = None,
+                 node_id: Optional[str] = None, message: str = "",
+                 checked_nodes: int = 0, mode: str = "full"):
+        self.valid = valid
+        self.rule = rule
+        self.node_id = node_id
+        self.message = message
+        self.checked_nodes = checked_nodes
+        self.mode = mode
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "valid": self.valid,
+            "rule": self.rule,
+            "nodeId": self.node_id,
+            "message": self.message,
+            "checkedNodes": self.checked_nodes,
+            "mode": self.mode
+        }
+
+
+def _check_node(arvore, no, chave_min: Optional[int], chave_max: Optional[int]) -> Violacao:
+    chaves = no.keys
+    quantidade = len(chaves)
+
+    if quantidade > arvore._max_keys:
+        return "max_keys", f"{quantidade} chave(s), máximo {arvore._max_keys}"
+    if no is arvore.root:
+        if quantidade == 0 and not no.leaf:
+            return "min_keys", "raiz interna sem chaves"
+    elif quantidade < arvore._min_keys and not (arvore._append_optimized and chave_max is None):
+        return "min_keys", f"{quantidade} chave(s), mínimo {arvore._min_keys}"
+
+    for i in range(quantidade - 1):
+        if chaves[i] >= chaves[i + 1]:
+            return "key_order", f"chaves fora de ordem: {chaves[i]} >= {chaves[i + 1]}"
+
+    if quantidade:
+        if chave_min is not None and chaves[0] <= chave_min:
+            return "key_bounds", f"chave {chaves[0]} não é maior que {chave_min}"
+        if chave_max is not None and chaves[-1] >= chave_max:
+            return "key_bounds", f"chave {chaves[-1]} não é menor que {chave_max}"
+
+    if no.leaf:
+        if no.children:
+            return "leaf_children", "folha com filhos"
+    elif len(no.children) != quantidade + 1:
+        return "child_count", f"{len(no.children)} filho(s) para {quantidade} chave(s)"
+
+    return None
+
+
+def _child_bounds(no, indice: int, chave_min: Optional[int],
+                  chave_max: Optional[int]) -> Tuple[Optional[int], Optional[int]]:
+    filho_min = no.keys[indice - 1] if indice > 0 else chave_min
+    filho_max = no.keys[indice] if indice < len(no.keys) else chave_max
+    return filho_min, filho_max
+
+
+def _leftmost_depth(arvore) -> int:
+    profundidade = 1
+    atual = arvore.root
+    while not atual.leaf and atual.children:
+        atual = atual.children[0]
+        profundidade += 1
+    return profundidade
+
+
+def _violation(modo: str, verificados: int, no, regra: str, mensagem: str) -> ValidationReport:
+    return ValidationReport(False, regra, no.id, mensagem, verificados, modo)
+
+
+def validate_tree(arvore) -> ValidationReport:
+    if not arvore.root:
+        return ValidationReport()
+
+    verificados = 0
+    profundidade_folhas = None
+    pilha = [(arvore.root, None, None, 1)]
+
+    while pilha:
+        no, chave_min, chave_max, profundidade = pilha.pop()
+        verificados += 1
+
+        violacao = _check_node(arvore, no, chave_min, chave_max)
+        if violacao:
+            return _violation("full", verificados, no, *violacao)
+
+        if no.leaf:
+            if profundidade_folhas is None:
+                profundidade_folhas = profundidade
+            elif profundidade != profundidade_folhas:
+                return _violation("full", verificados, no, "leaf_depth",
+                                  f"folha na profundidade {profundidade}, esperado {profundidade_folhas}")
+            continue
+
+        for indice in range(len(no.children) - 1, -1, -1):
+            filho_min, filho_max = _child_bounds(no, indice, chave_min, chave_max)
+            pilha.append((no.children[indice], filho_min, filho_max, profundidade + 1))
+
+    return ValidationReport(checked_nodes=verificados)
+
+
+def validate_sampled(arvore, amostras: int, semente: Optional[int] = None) -> ValidationReport:
+    if not arvore.root:
+        return ValidationReport(mode="sampled")
+
+    gerador = random.Random(semente)
+    altura = _leftmost_depth(arvore)
+    verificados = 0
+
+    for _ in range(amostras):
+        no, chave_min, chave_max, profundidade = arvore.root, None, None, 1
+
+        while True:
+            verificados += 1
+            violacao = _check_node(arvore, no, chave_min, chave_max)
+            if violacao:
+                return _violation("sampled", verificados, no, *violacao)
+
+            if no.leaf:
+                if profundidade != altura:
+                    return _violation("sampled", verificados, no, "leaf_depth",
+                                      f"folha na profundidade {profundidade}, esperado {altura}")
+                break
+
+            indice = gerador.randrange(len(no.children))
+            chave_min, chave_max = _child_bounds(no, indice, chave_min, chave_max)
+            no = no.children[indice]
+            profundidade += 1
+
+    return ValidationReport(checked_nodes=verificados, mode="sampled")
+
+
+def validate_incremental(arvore, tocados: Set) -> ValidationReport:
+    if not arvore.root:
+        return ValidationReport(mode="incremental")
+
+    altura = _leftmost_depth(arvore)
+    verificados = 0
+    pilha = [(arvore.root, None, None, 1)]
+
+    while pilha:
+        no, chave_min, chave_max, profundidade = pilha.pop()
+        if no not in tocados:
+            continue
+
+        verificar: List[Tuple[Any, Optional[int], Optional[int], int]] = [
+            (no, chave_min, chave_max, profundidade)
+        ]
+        if not no.leaf:
+            for indice, filho in enumerate(no.children):
+                filho_min, filho_max = _child_bounds(no, indice, chave_min, chave_max)
+                if filho in tocados:
+                    pilha.append((filho, filho_min, filho_max, profundidade + 1))
+                else:
+                    verificar.append((filho, filho_min, filho_max, profundidade + 1))
+
+        for atual, atual_min, atual_max, atual_profundidade in verificar:
+            verificados += 1
+            violacao = _check_node(arvore, atual, atual_min, atual_max)
+            if violacao:
+                return _violation("incremental", verificados, atual, *violacao)
+            if atual.leaf and atual_profundidade != altura:
+                return _violation("incremental", verificados, atual, "leaf_depth",
+                                  f"folha na profundidade {atual_profundidade}, esperado {altura}")
+
+    return ValidationReport(checked_nodes=verificados, mode="incremental")
@@ -0,0 +1,158 @@
+import bisect
+import itertools
+import random
+import struct
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .instrumentation import LatencyHistogram
+
+INSERT, DELETE, SEARCH = 0, 1, 2
+NOMES_OPERACOES = ("insert", "delete", "search")
+DISTRIBUICOES = ("uniform", "zipfian", "sequential", "sliding_window")
+
+MAGICO = b"YGTR"
+VERSAO = 1
+CABECALHO = struct.Struct("<4sB")
+REGISTRO = struct.Struct("<Bq")
+
+Operacao = Tuple[int, int]
+
+
+class _Zipf:
+
+    def __init__(self, tamanho: int, expoente: float, gerador: random.Random):
+        pesos = (1.0 / (rank ** expoente) for rank in range(1, tamanho + 1))
+        self._acumulado = list(itertools.accumulate(pesos))
+        self._gerador = gerador
+
+    def sample(self) -> int:
+        alvo = self._gerador.random() * self._acumulado[-1]
+        return bisect.bisect_left(self._acumulado, alvo)
+
+
+def generate_trace(quantidade: int, mix: Sequence[float] = (0.5, 0.1, 0.4),
+                   distribution: str = "uniform", key_space: int = 1_000_000,
+                   zipf_exponent: float = 1.1, window: int = 10_000,
+                   seed: Optional[int] = None) -> Iterator[Operacao]:
+    if distribution not in DISTRIBUICOES:
+        raise ValueError(f"Distribuição desconhecida: {distribution}")
+    if len(mix) != 3 or sum(mix) <= 0 or min(mix) < 0:
+        raise ValueError("A mistura deve ter três pesos não negativos (insert, delete, search)")
+    if distribution == "sliding_window" and window < 1:
+        raise ValueError("A janela deve ter pelo menos 1 chave")
+
+    gerador = random.Random(seed)
+    pesos_operacoes = list(itertools.accumulate(mix))
+    zipf = _Zipf(key_space, zipf_exponent, gerador) if distribution == "zipfian" else None
+
+    proxima = 0
+    mais_antiga = 0
+    insercao_pendente = False
+
+    for _ in range(quantidade):
+        if insercao_pendente:
+            operacao = INSERT
+            insercao_pendente = False
+        else:
+            operacao = bisect.bisect_right(pesos_operacoes, gerador.random() * pesos_operacoes[-1])
+            operacao = min(operacao, SEARCH)
+
+        if distribution == "uniform":
+            chave = gerador.randrange(key_space)
+        elif distribution == "zipfian":
+            chave = zipf.sample()
+        elif distribution == "sliding_window" and operacao == INSERT and proxima - mais_antiga >= window:
+            chave = mais_antiga
+            mais_antiga += 1
+            operacao = DELETE
+            insercao_pendente = True
+        elif operacao == INSERT:
+            chave = proxima
+            proxima += 1
+        elif distribution == "sliding_window":
+            if operacao == DELETE and proxima > mais_antiga:
+                chave = mais_antiga
+                mais_antiga += 1
+            else:
+                chave = gerador.randrange(mais_antiga, proxima) if proxima > mais_antiga else 0
+                operacao = SEARCH
+        else:
+            chave = gerador.randrange(proxima) if proxima else 0
+
+        yield operacao, chave
+
+
+def write_trace(caminho: str, operacoes: Iterable[Operacao], tamanho_bloco: int = 4096) -> int:
+    total = 0
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(CABECALHO.pack(MAGICO, VERSAO))
+
+        iterador = iter(operacoes)
+        while True:
+            bloco = list(itertools.islice(iterador, tamanho_bloco))
+            if not bloco:
+                break
+            arquivo.write(b"".join(REGISTRO.pack(operacao, chave) for operacao, chave in bloco))
+            total += len(bloco)
+
+    return total
+
+
+def read_trace(caminho: str, tamanho_bloco: int = 4096) -> Iterator[List[Operacao]]:
+    with open(caminho, "rb") as arquivo:
+        cabecalho = arquivo.read(CABECALHO.size)
+        if len(cabecalho) != CABECALHO.size:
+            raise ValueError("Arquivo de trace vazio ou truncado")
+        magico, versao = CABECALHO.unpack(cabecalho)
+        if magico != MAGICO or versao != VERSAO:
+            raise ValueError(f"Arquivo de trace inválido: {caminho}")
+
+        while True:
+            dados = arquivo.read(tamanho_bloco * REGISTRO.size)
+            if not dados:
+                break
+            if len(dados) % REGISTRO.size:
+                raise ValueError("Arquivo de trace truncado")
+            operacao = max(dados[::REGISTRO.size])
+            if operacao > SEARCH:
+                raise ValueError(f"Arquivo de trace inválido: operação desconhecida {operacao}")
+            yield list(REGISTRO.iter_unpack(dados))
+
+
+def replay(arvore, blocos: Iterable[List[Operacao]], events: bool = False) -> Dict[str, Any]:
+    metodos = (arvore.insert, arvore.delete, arvore.search)
+    latencias = [LatencyHistogram() for _ in NOMES_OPERACOES]
+    relogio = time.perf_counter_ns
+
+    eventos_anteriores = arvore.events_enabled
+    arvore.events_enabled = events
+    try:
+        inicio = relogio()
+        for bloco in blocos:
+            for operacao, chave in bloco:
+                antes = relogio()
+                metodos[operacao](chave)
+                latencias[operacao].record(relogio() - antes)
+        duracao = (relogio() - inicio) / 1e9
+    finally:
+        arvore.events_enabled = eventos_anteriores
+
+    total = sum(histograma.count for histograma in latencias)
+    geral = LatencyHistogram()
+    for histograma in latencias:
+        geral.merge(histograma)
+
+    latencia = {"all": geral.to_dict()}
+    for nome, histograma in zip(NOMES_OPERACOES, latencias):
+        if histograma.count:
+            latencia[nome] = histograma.to_dict()
+
+    return {
+        "operations": total,
+        "seconds": duracao,
+        "opsPerSec": total / duracao if duracao else 0.0,
+        "events": events,
+        "latency": latencia,
+        "metrics": arvore.metrics()
+    }
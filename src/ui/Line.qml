@@ -10,6 +10,7 @@ Shape {
     property real y2: 0
     property color lineColor: "#52525b"
     property real lineWidth: 2.5
+    property bool animated: true
 
     width: Math.abs(x2 - x1) + lineWidth * 2
     height: Math.abs(y2 - y1) + lineWidth * 2
@@ -34,6 +35,7 @@ Shape {
 
     // Smooth animations
     Behavior on x1 {
+        enabled: line.animated
         PropertyAnimation {
             duration: 600
             easing.type: Easing.OutCubic
@@ -41,6 +43,7 @@ Shape {
     }
 
     Behavior on y1 {
+        enabled: line.animated
         PropertyAnimation {
             duration: 600
             easing.type: Easing.OutCubic
@@ -48,6 +51,7 @@ Shape {
     }
 
     Behavior on x2 {
+        enabled: line.animated
         PropertyAnimation {
             duration: 600
             easing.type: Easing.OutCubic
@@ -55,6 +59,7 @@ Shape {
     }
 
     Behavior on y2 {
+        enabled: line.animated
         PropertyAnimation {
             duration: 600
             easing.type: Easing.OutCubic
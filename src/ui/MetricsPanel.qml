@@ -5,16 +5,38 @@ import QtQuick.Layouts 1.15
 ColumnLayout {
     id: metricsPanel
     spacing: 16
-    Layout.preferredHeight: 260
+    Layout.preferredHeight: 420
 
     property int treeHeight: 0
     property int totalNodes: 0
     property int totalKeys: 0
+    property real fillFactor: 0
+    property real opsPerSec: 0
+    property real splitsPerSec: 0
+    property real p99Latency: 0
 
     function updateMetrics(metrics) {
         treeHeight = metrics.height || 0
         totalNodes = metrics.totalNodes || 0
         totalKeys = metrics.totalKeys || 0
+        fillFactor = metrics.fillFactor || 0
+    }
+
+    function updateProfile(profile) {
+        opsPerSec = profile.opsPerSec || 0
+        splitsPerSec = profile.splitsPerSec || 0
+        p99Latency = profile.p99Us || 0
+    }
+
+    function formatRate(value) {
+        if (value >= 1000000) return (value / 1000000).toFixed(1) + "M/s"
+        if (value >= 1000) return (value / 1000).toFixed(1) + "k/s"
+        return value.toFixed(0) + "/s"
+    }
+
+    function formatLatency(us) {
+        if (us >= 1000) return (us / 1000).toFixed(2) + " ms"
+        return us.toFixed(0) + " µs"
     }
 
     // Metrics Header
@@ -28,7 +50,7 @@ ColumnLayout {
     // Metrics Container
     Rectangle {
         Layout.fillWidth: true
-        Layout.preferredHeight: 220
+        Layout.preferredHeight: 380
         color: "#18181b"
         border.color: "#27272a"
         border.width: 1
@@ -136,6 +158,134 @@ ColumnLayout {
                 }
             }
 
+            // Fill Factor Metric
+            Row {
+                Layout.fillWidth: true
+                Layout.preferredHeight: 24
+                spacing: 8
+
+                Rectangle {
+                    width: 8
+                    height: 8
+                    color: "#14b8a6"
+                    radius: 4
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+
+                Text {
+                    text: "Ocupação:"
+                    font.pixelSize: 12
+                    color: "#a1a1aa"
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+
+                Item { Layout.fillWidth: true }
+
+                Text {
+                    text: (metricsPanel.fillFactor * 100).toFixed(1) + "%"
+                    font.pixelSize: 12
+                    font.weight: Font.Medium
+                    color: "#ffffff"
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+            }
+
+            // Throughput Metric
+            Row {
+                Layout.fillWidth: true
+                Layout.preferredHeight: 24
+                spacing: 8
+
+                Rectangle {
+                    width: 8
+                    height: 8
+                    color: "#8b5cf6"
+                    radius: 4
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+
+                Text {
+                    text: "Operações:"
+                    font.pixelSize: 12
+                    color: "#a1a1aa"
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+
+                Item { Layout.fillWidth: true }
+
+                Text {
+                    text: metricsPanel.formatRate(metricsPanel.opsPerSec)
+                    font.pixelSize: 12
+                    font.weight: Font.Medium
+                    color: "#ffffff"
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+            }
+
+            // Splits Metric
+            Row {
+                Layout.fillWidth: true
+                Layout.preferredHeight: 24
+                spacing: 8
+
+                Rectangle {
+                    width: 8
+                    height: 8
+                    color: "#ec4899"
+                    radius: 4
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+
+                Text {
+                    text: "Divisões:"
+                    font.pixelSize: 12
+                    color: "#a1a1aa"
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+
+                Item { Layout.fillWidth: true }
+
+                Text {
+                    text: metricsPanel.formatRate(metricsPanel.splitsPerSec)
+                    font.pixelSize: 12
+                    font.weight: Font.Medium
+                    color: "#ffffff"
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+            }
+
+            // Latency Metric
+            Row {
+                Layout.fillWidth: true
+                Layout.preferredHeight: 24
+                spacing: 8
+
+                Rectangle {
+                    width: 8
+                    height: 8
+                    color: "#ef4444"
+                    radius: 4
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+
+                Text {
+                    text: "Latência p99:"
+                    font.pixelSize: 12
+                    color: "#a1a1aa"
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+
+                Item { Layout.fillWidth: true }
+
+                Text {
+                    text: metricsPanel.formatLatency(metricsPanel.p99Latency)
+                    font.pixelSize: 12
+                    font.weight: Font.Medium
+                    color: "#ffffff"
+                    anchors.verticalCenter: parent.verticalCenter
+                }
+            }
+
             // Tree Config Info
             Rectangle {
                 Layout.fillWidth: true
@@ -12,17 +12,49 @@ Item {
     property var nodes: []
     property var edges: []
     property var selectedNodeId: null
+    property var nodeItems: ({})
+    property var edgeItems: ({})
+    property var nodePool: []
+    property var edgePool: []
+    property var retiringNodes: []
+    property int poolLimit: 64
 
     signal nodeClicked(string nodeId)
     signal nodeDoubleClicked(string nodeId)
 
     function updateTree(newNodes, newEdges) {
+        var previous = nodeItems
+        var current = {}
+        var spawnByLevel = {}
+
+        // Keyed diff: surviving nodes keep their delegate and animate to the new position
+        for (var i = 0; i < newNodes.length; i++) {
+            var data = newNodes[i]
+            var item = previous[data.id]
+
+            if (item) {
+                delete previous[data.id]
+                spawnByLevel[data.y] = { x: item.centerX, y: item.centerY }
+                if (item.keys.join(",") !== data.keys.join(",")) {
+                    item.keys = data.keys
+                }
+                item.isLeaf = data.isLeaf
+            } else {
+                // New nodes (e.g. split halves) grow out of their left neighbour's old spot
+                var origin = spawnByLevel[data.y]
+                item = acquireNode(data, origin ? origin.x : data.x, origin ? origin.y : data.y)
+            }
+
+            item.centerX = data.x
+            item.centerY = data.y
+            current[data.id] = item
+        }
+
+        retireNodes(previous, current)
+        nodeItems = current
         nodes = newNodes
-        edges = newEdges
 
-        // Update repeaters
-        nodeRepeater.model = nodes
-        edgeRepeater.model = edges
+        updateEdges(newEdges)
 
         // Auto-fit if first time
         if (nodes.length > 0 && zoomLevel === 1.0 && panX === 0 && panY === 0) {
@@ -30,6 +62,133 @@ Item {
         }
     }
 
+    function retireNodes(removed, current) {
+        var removedIds = Object.keys(removed)
+        if (removedIds.length === 0) return
+
+        // Merged nodes slide into the surviving node to their left on the same level
+        var survivorByLevel = {}
+        var targets = {}
+        for (var i = 0; i < nodes.length; i++) {
+            var old = nodes[i]
+            if (current[old.id]) {
+                survivorByLevel[old.y] = current[old.id]
+            } else if (removed[old.id]) {
+                targets[old.id] = survivorByLevel[old.y] || null
+            }
+        }
+
+        for (var j = 0; j < removedIds.length; j++) {
+            var item = removed[removedIds[j]]
+            var target = targets[removedIds[j]]
+            if (target) {
+                item.centerX = target.centerX
+                item.centerY = target.centerY
+            }
+            item.z = -1
+            item.opacity = 0
+            retiringNodes.push(item)
+        }
+        retireTimer.restart()
+    }
+
+    function acquireNode(data, startX, startY) {
+        var item = nodePool.pop()
+
+        if (item) {
+            item.moveAnimated = false
+            item.nodeId = data.id
+            item.keys = data.keys
+            item.isLeaf = data.isLeaf
+            item.centerX = startX
+            item.centerY = startY
+            item.z = 0
+            item.visible = true
+            item.moveAnimated = true
+        } else {
+            item = nodeComponent.createObject(nodeLayer, {
+                nodeId: data.id,
+                keys: data.keys,
+                isLeaf: data.isLeaf,
+                centerX: startX,
+                centerY: startY,
+                opacity: 0
+            })
+        }
+
+        item.opacity = 1
+        return item
+    }
+
+    function releaseNode(item) {
+        if (nodePool.length >= poolLimit) {
+            item.destroy()
+            return
+        }
+        item.visible = false
+        item.nodeId = ""
+        nodePool.push(item)
+    }
+
+    function updateEdges(newEdges) {
+        var previous = edgeItems
+        var current = {}
+
+        for (var i = 0; i < newEdges.length; i++) {
+            var key = newEdges[i].fromId + ">" + newEdges[i].toId
+            var edge = previous[key]
+
+            if (edge) {
+                delete previous[key]
+            } else {
+                edge = acquireEdge(nodeItems[newEdges[i].fromId], nodeItems[newEdges[i].toId])
+            }
+            current[key] = edge
+        }
+
+        for (var stale in previous) {
+            releaseEdge(previous[stale])
+        }
+
+        edgeItems = current
+        edges = newEdges
+    }
+
+    function acquireEdge(fromItem, toItem) {
+        var edge = edgePool.pop()
+
+        if (edge) {
+            edge.fromItem = fromItem
+            edge.toItem = toItem
+            edge.visible = true
+            return edge
+        }
+        return edgeComponent.createObject(edgeLayer, { fromItem: fromItem, toItem: toItem })
+    }
+
+    function releaseEdge(edge) {
+        if (edgePool.length >= poolLimit) {
+            edge.destroy()
+            return
+        }
+        edge.visible = false
+        edge.fromItem = null
+        edge.toItem = null
+        edgePool.push(edge)
+    }
+
+    Timer {
+        id: retireTimer
+        interval: canvas.animationDuration
+        onTriggered: {
+            var items = canvas.retiringNodes
+            canvas.retiringNodes = []
+            for (var i = 0; i < items.length; i++) {
+                canvas.releaseNode(items[i])
+            }
+        }
+    }
+
     function playAnimation(events) {
         // Smart animation that highlights the correct node
         if (events.length === 0) return
@@ -113,12 +272,9 @@ Item {
     }
 
     function highlightNode(nodeId) {
-        for (var i = 0; i < nodeRepeater.count; i++) {
-            var nodeItem = nodeRepeater.itemAt(i)
-            if (nodeItem && nodeItem.nodeId === nodeId) {
-                nodeItem.highlight()
-                break
-            }
+        var nodeItem = nodeItems[nodeId]
+        if (nodeItem) {
+            nodeItem.highlight()
         }
     }
 
@@ -206,44 +362,46 @@ Item {
                 }
             ]
 
-            // Edges layer
-            Repeater {
-                id: edgeRepeater
-                model: canvas.edges
+            // Edges layer (delegates created and recycled by updateEdges)
+            Item {
+                id: edgeLayer
+                anchors.fill: parent
+            }
 
-                delegate: Line {
-                    property var fromNode: findNode(modelData.fromId)
-                    property var toNode: findNode(modelData.toId)
+            // Nodes layer (delegates keyed by node id, recycled through nodePool)
+            Item {
+                id: nodeLayer
+                anchors.fill: parent
+            }
 
-                    x1: fromNode ? fromNode.x : 0
-                    y1: fromNode ? fromNode.y + 35 : 0
-                    x2: toNode ? toNode.x : 0
-                    y2: toNode ? toNode.y - 15 : 0
-                    lineColor: "#52525b"
+            Component {
+                id: edgeComponent
 
-                    function findNode(id) {
-                        for (var i = 0; i < canvas.nodes.length; i++) {
-                            if (canvas.nodes[i].id === id) {
-                                return canvas.nodes[i]
-                            }
-                        }
-                        return null
-                    }
+                Line {
+                    property var fromItem: null
+                    property var toItem: null
+
+                    // Endpoints follow the node delegates, which already animate
+                    animated: false
+                    x1: fromItem ? fromItem.centerX : 0
+                    y1: fromItem ? fromItem.centerY + 35 : 0
+                    x2: toItem ? toItem.centerX : 0
+                    y2: toItem ? toItem.centerY - 15 : 0
+                    lineColor: "#52525b"
                 }
             }
 
-            // Nodes layer
-            Repeater {
-                id: nodeRepeater
-                model: canvas.nodes
+            Component {
+                id: nodeComponent
 
-                delegate: Node {
-                    nodeId: modelData.id
-                    keys: modelData.keys
-                    isLeaf: modelData.isLeaf
-                    x: modelData.x - width/2
-                    y: modelData.y - height/2
-                    selected: canvas.selectedNodeId === modelData.id
+                Node {
+                    property real centerX: 0
+                    property real centerY: 0
+                    property bool moveAnimated: true
+
+                    x: centerX - width/2
+                    y: centerY - height/2
+                    selected: canvas.selectedNodeId === nodeId
 
                     onClicked: {
                         canvas.selectedNodeId = nodeId
@@ -255,19 +413,26 @@ Item {
                         canvas.nodeDoubleClicked(nodeId)
                     }
 
-                    Behavior on x {
+                    Behavior on centerX {
+                        enabled: moveAnimated
                         NumberAnimation { 
                             duration: canvas.animationDuration
                             easing.type: Easing.OutCubic
                         }
                     }
 
-                    Behavior on y {
+                    Behavior on centerY {
+                        enabled: moveAnimated
                         NumberAnimation { 
                             duration: canvas.animationDuration
                             easing.type: Easing.OutCubic
                         }
                     }
+
+                    Behavior on opacity {
+                        enabled: moveAnimated
+                        NumberAnimation { duration: canvas.animationDuration / 2 }
+                    }
                 }
             }
 
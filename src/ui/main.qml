@@ -26,6 +26,10 @@ ApplicationWindow {
             metricsPanel.updateMetrics(metrics)
         }
 
+        onProfileChanged: function(profile) {
+            metricsPanel.updateProfile(profile)
+        }
+
         onEventsReady: function(events) {
             canvas.playAnimation(events)
         }
@@ -122,7 +126,7 @@ ApplicationWindow {
                                         font.pixelSize: 14
                                         color: "#ffffff"
                                         selectByMouse: true
-                                        validator: IntValidator { bottom: 2; top: 20 }
+                                        validator: IntValidator { bottom: 3; top: 20 }
                                         verticalAlignment: TextInput.AlignVCenter
                                         
                                         Keys.onReturnPressed: confirmDegree()
@@ -608,7 +612,7 @@ ApplicationWindow {
     // Helper functions for actions
     function confirmDegree() {
         let value = parseInt(degreeInput.text)
-        if (value >= 2 && value <= 20) {
+        if (value >= 3 && value <= 20) {
             bridge.degree = value
         } else {
             degreeInput.text = bridge.degree.toString()